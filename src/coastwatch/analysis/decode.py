@@ -0,0 +1,39 @@
+"""Shared JPEG decoding for the analysis stages."""
+
+from __future__ import annotations
+
+import logging
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_JPEG_MAGIC = b"\xff\xd8\xff"
+
+# libjpeg-turbo decodes JPEG 2-3x faster than OpenCV's bundled codec thanks
+# to SIMD Huffman decoding + IDCT. Optional: install with `pip install coastwatch[turbo]`.
+try:
+    from turbojpeg import TJPF_BGR, TurboJPEG
+    _turbo: "TurboJPEG | None" = TurboJPEG()
+except Exception:
+    _turbo = None
+
+
+def decode_bgr(image: bytes | np.ndarray) -> np.ndarray | None:
+    """Decode an image to a BGR ndarray, or None on failure.
+
+    A pre-decoded ndarray passes through untouched, so callers can share
+    one decode across stages. Uses libjpeg-turbo for JPEG payloads when
+    PyTurboJPEG is installed, falling back to cv2.imdecode for other
+    formats (PNG, etc.) or when the turbo decode fails.
+    """
+    if isinstance(image, np.ndarray):
+        return image
+    if _turbo is not None and image[:3] == _JPEG_MAGIC:
+        try:
+            return _turbo.decode(image, pixel_format=TJPF_BGR)
+        except Exception as e:
+            logger.debug("turbojpeg decode failed, falling back to OpenCV: %s", e)
+    arr = np.frombuffer(image, dtype=np.uint8)
+    return cv2.imdecode(arr, cv2.IMREAD_COLOR)
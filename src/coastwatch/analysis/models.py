@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # --- Person detection (YOLO) ---
@@ -25,7 +25,7 @@ class WaveEstimate(BaseModel):
 class ImageQuality(BaseModel):
     is_usable: bool = True
     quality_score: float = 1.0
-    issues: list[str] = []
+    issues: list[str] = Field(default_factory=list)
 
 
 class CameraStatus(BaseModel):
@@ -34,9 +34,9 @@ class CameraStatus(BaseModel):
 
 
 class LocalAnalysisResult(BaseModel):
-    waves: WaveEstimate = WaveEstimate()
-    image_quality: ImageQuality = ImageQuality()
-    camera_status: CameraStatus = CameraStatus()
+    waves: WaveEstimate = Field(default_factory=WaveEstimate)
+    image_quality: ImageQuality = Field(default_factory=ImageQuality)
+    camera_status: CameraStatus = Field(default_factory=CameraStatus)
 
 
 # --- Weather API data ---
@@ -84,7 +84,7 @@ class WeatherAnalysis(BaseModel):
 class CurrentAnalysis(BaseModel):
     danger_level: str = "unknown"  # safe|low|moderate|high|extreme
     rip_current_detected: bool = False
-    indicators: list[str] = []
+    indicators: list[str] = Field(default_factory=list)
     notes: str = ""
 
 
@@ -92,12 +92,12 @@ class OverallAnalysis(BaseModel):
     beach_score: float = 5.0
     surf_score: float | None = None
     summary: str = ""
-    best_for: list[str] = []
+    best_for: list[str] = Field(default_factory=list)
 
 
 class VisionAnalysis(BaseModel):
-    crowd: CrowdAnalysis = CrowdAnalysis()
-    waves: WaveAnalysis = WaveAnalysis()
-    weather: WeatherAnalysis = WeatherAnalysis()
-    currents: CurrentAnalysis = CurrentAnalysis()
-    overall: OverallAnalysis = OverallAnalysis()
+    crowd: CrowdAnalysis = Field(default_factory=CrowdAnalysis)
+    waves: WaveAnalysis = Field(default_factory=WaveAnalysis)
+    weather: WeatherAnalysis = Field(default_factory=WeatherAnalysis)
+    currents: CurrentAnalysis = Field(default_factory=CurrentAnalysis)
+    overall: OverallAnalysis = Field(default_factory=OverallAnalysis)
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+import threading
 
 import cv2
 import numpy as np
 
+from coastwatch.analysis.decode import decode_bgr
 from coastwatch.analysis.models import (
     CameraStatus,
     ImageQuality,
@@ -18,6 +20,56 @@ from coastwatch.config.models import CameraSettings, OpenCVSettings
 
 logger = logging.getLogger(__name__)
 
+# All wave/quality heuristics are ratio-based, so analysis runs at a fixed
+# working resolution: a 1080p frame costs ~9x the bandwidth of 640px for
+# identical classifications.
+MAX_ANALYSIS_DIM = 640
+
+# Quality issues as bit flags; score and issue lists precomputed for all 16
+# combinations so _assess_quality does a single table lookup per frame.
+_QUALITY_ISSUES = ("too_small", "too_dark", "too_blurry", "solid_color")
+_QUALITY_PENALTIES = (0.3, 0.4, 0.3, 0.5)
+_SCORE_TABLE = tuple(
+    round(max(0.0, 1.0 - sum(p for i, p in enumerate(_QUALITY_PENALTIES) if bits & (1 << i))), 2)
+    for bits in range(16)
+)
+_ISSUE_TABLE = tuple(
+    tuple(name for i, name in enumerate(_QUALITY_ISSUES) if bits & (1 << i))
+    for bits in range(16)
+)
+
+_WAVE_LEVELS = ("flat", "small", "medium", "large", "heavy")
+
+
+def _wave_stats(
+    whitecap_pixels: int,
+    whitecap_total: int,
+    edge_pixels: int,
+    edge_total: int,
+) -> tuple[int, float, float, float]:
+    """Classify wave level from raw pixel counts.
+
+    Returns (level_index, whitecap_ratio, edge_density, confidence);
+    level_index indexes into _WAVE_LEVELS.
+    """
+    whitecap_ratio = whitecap_pixels / whitecap_total if whitecap_total > 0 else 0.0
+    edge_density = edge_pixels / edge_total if edge_total > 0 else 0.0
+    wave_metric = whitecap_ratio * 0.6 + edge_density * 0.4
+
+    if wave_metric < 0.01:
+        level = 0
+    elif wave_metric < 0.03:
+        level = 1
+    elif wave_metric < 0.06:
+        level = 2
+    elif wave_metric < 0.10:
+        level = 3
+    else:
+        level = 4
+
+    confidence = min(0.8, 0.4 + wave_metric * 5)
+    return level, whitecap_ratio, edge_density, confidence
+
 
 class ImageAnalyzer:
     """Analyzes beach webcam frames: wave detection and camera status."""
@@ -29,148 +81,226 @@ class ImageAnalyzer:
     ):
         self._s = opencv_settings or OpenCVSettings()
         self._cam = camera_settings or CameraSettings()
+        # Scratch buffers reused across frames, keyed by frame shape. Webcams
+        # deliver a fixed resolution, so this avoids per-frame ndarray churn.
+        # Held per-thread: analyze() runs concurrently on executor threads,
+        # and two same-resolution frames must not share dst= arrays.
+        self._local = threading.local()
+
+    def is_night(self, latitude: float, longitude: float, timezone: str) -> bool:
+        """True when the solar gate applies: sun below horizon at location."""
+        return self._cam.use_solar and latitude != 0.0 and not is_daylight(latitude, longitude, timezone)
 
     def analyze(
         self,
-        image_bytes: bytes,
+        image: bytes | np.ndarray,
         latitude: float = 0.0,
         longitude: float = 0.0,
         timezone: str = "Europe/Paris",
     ) -> LocalAnalysisResult:
-        """Run wave analysis and camera status detection on a single frame."""
-        img = self._decode_image(image_bytes)
+        """Run wave analysis and camera status detection on a single frame.
+
+        Accepts raw encoded bytes or a pre-decoded BGR ndarray (shared with
+        other stages to avoid decoding the same frame twice).
+        """
+        # Solar gate: when the sun is down there is nothing to analyze, so
+        # skip decode and all OpenCV work entirely (~12h/day per camera).
+        if self.is_night(latitude, longitude, timezone):
+            return LocalAnalysisResult.model_construct(
+                waves=WaveEstimate(),
+                image_quality=ImageQuality(),
+                camera_status=CameraStatus.model_construct(
+                    status="night", reason="Nighttime at location"
+                ),
+            )
+
+        img = self._decode_image(image)
         if img is None:
-            return LocalAnalysisResult(
-                image_quality=ImageQuality(is_usable=False, quality_score=0.0, issues=["decode_failed"]),
-                camera_status=CameraStatus(status="offline", reason="Image decode failed"),
+            return LocalAnalysisResult.model_construct(
+                waves=WaveEstimate(),
+                image_quality=ImageQuality.model_construct(
+                    is_usable=False, quality_score=0.0, issues=["decode_failed"]
+                ),
+                camera_status=CameraStatus.model_construct(status="offline", reason="Image decode failed"),
             )
 
-        quality = self._assess_quality(img)
-        camera_status = self._detect_camera_status(img, quality, latitude, longitude, timezone)
+        # Source dimensions before downsampling: the minimum-size quality
+        # check must see what the camera delivered, not the working copy.
+        src_h, src_w = img.shape[:2]
+        img = self._downsample(img)
+
+        # Single grayscale conversion + mean/std pass shared by quality
+        # assessment, camera status detection, and wave analysis.
+        buffers = self._get_buffers(*img.shape[:2])
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY, dst=buffers["gray"])
+        mean, std = cv2.meanStdDev(gray)
+        mean_brightness = float(mean[0, 0])
+        std_dev = float(std[0, 0])
+
+        quality = self._assess_quality(src_h, src_w, gray, mean_brightness, std_dev)
+        camera_status = self._detect_camera_status(mean_brightness, std_dev, latitude, longitude, timezone)
 
         if camera_status.status != "working":
-            return LocalAnalysisResult(
+            return LocalAnalysisResult.model_construct(
+                waves=WaveEstimate(),
                 image_quality=quality,
                 camera_status=camera_status,
             )
 
-        return LocalAnalysisResult(
-            waves=self._analyze_waves(img),
+        return LocalAnalysisResult.model_construct(
+            waves=self._analyze_waves(img, gray, buffers),
             image_quality=quality,
             camera_status=camera_status,
         )
 
-    def _decode_image(self, image_bytes: bytes) -> np.ndarray | None:
-        arr = np.frombuffer(image_bytes, dtype=np.uint8)
-        return cv2.imdecode(arr, cv2.IMREAD_COLOR)
+    def _downsample(self, img: np.ndarray) -> np.ndarray:
+        """Resize to the working resolution if the frame is larger."""
+        h, w = img.shape[:2]
+        scale = MAX_ANALYSIS_DIM / max(h, w)
+        if scale >= 1.0:
+            return img
+        new_h, new_w = int(h * scale), int(w * scale)
+        resize_bufs = getattr(self._local, "resize_bufs", None)
+        if resize_bufs is None:
+            resize_bufs = self._local.resize_bufs = {}
+        dst = resize_bufs.get((new_h, new_w))
+        if dst is None:
+            dst = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            resize_bufs[(new_h, new_w)] = dst
+        return cv2.resize(img, (new_w, new_h), dst=dst, interpolation=cv2.INTER_AREA)
+
+    def _get_buffers(self, h: int, w: int) -> dict[str, np.ndarray]:
+        """Return (allocating once per thread and frame shape) the scratch buffers."""
+        cache = getattr(self._local, "buffers", None)
+        if cache is None:
+            cache = self._local.buffers = {}
+        buffers = cache.get((h, w))
+        if buffers is None:
+            water_h = h - int(h * 0.4)
+            half_h, half_w = (water_h + 1) // 2, (w + 1) // 2
+            buffers = {
+                "gray": np.empty((h, w), dtype=np.uint8),
+                "water_small": np.empty((half_h, half_w), dtype=np.uint8),
+                "edges": np.empty((half_h, half_w), dtype=np.uint8),
+                "min_channel": np.empty((water_h, w), dtype=np.uint8),
+                "whitecap_mask": np.empty((water_h, w), dtype=np.uint8),
+            }
+            cache[(h, w)] = buffers
+        return buffers
+
+    def _decode_image(self, image: bytes | np.ndarray) -> np.ndarray | None:
+        return decode_bgr(image)
 
     def _detect_camera_status(
         self,
-        img: np.ndarray,
-        quality: ImageQuality,
+        mean_brightness: float,
+        std_dev: float,
         latitude: float,
         longitude: float,
         timezone: str,
     ) -> CameraStatus:
         """Determine camera status: working, night, offline, or obstructed."""
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        mean_brightness = float(np.mean(gray))
-        std_dev = float(np.std(gray))
-
         # Very dark image
         if mean_brightness < self._cam.brightness_night_threshold:
             if self._cam.use_solar and latitude != 0.0:
                 if not is_daylight(latitude, longitude, timezone):
-                    return CameraStatus(status="night", reason="Dark image during nighttime")
+                    return CameraStatus.model_construct(status="night", reason="Dark image during nighttime")
                 else:
-                    return CameraStatus(status="offline", reason="Dark image during daytime — camera likely offline")
-            return CameraStatus(status="night", reason="Very dark image")
+                    return CameraStatus.model_construct(status="offline", reason="Dark image during daytime — camera likely offline")
+            return CameraStatus.model_construct(status="night", reason="Very dark image")
 
         # Solid color (lens cap, frozen frame, etc.)
         if std_dev < self._cam.solid_color_std_threshold:
-            return CameraStatus(status="obstructed", reason=f"Uniform image (std={std_dev:.1f})")
+            return CameraStatus.model_construct(status="obstructed", reason=f"Uniform image (std={std_dev:.1f})")
 
         # Extremely low brightness but not pitch black
         if mean_brightness < self._cam.brightness_offline_threshold:
-            return CameraStatus(status="offline", reason=f"Very low brightness ({mean_brightness:.0f})")
+            return CameraStatus.model_construct(status="offline", reason=f"Very low brightness ({mean_brightness:.0f})")
 
-        return CameraStatus(status="working", reason="")
+        return CameraStatus.model_construct(status="working", reason="")
 
-    def _analyze_waves(self, img: np.ndarray) -> WaveEstimate:
+    def _analyze_waves(
+        self,
+        img: np.ndarray,
+        gray: np.ndarray,
+        buffers: dict[str, np.ndarray],
+    ) -> WaveEstimate:
         """Wave analysis via edge detection and whitecap segmentation."""
         h, w = img.shape[:2]
         water_region = img[int(h * 0.4):, :]
 
-        # Whitecap detection (white foam on water)
-        hsv = cv2.cvtColor(water_region, cv2.COLOR_BGR2HSV)
-        whitecap_mask = cv2.inRange(hsv, (0, 0, 200), (180, 50, 255))
-        total_pixels = whitecap_mask.size
+        # Whitecap detection (white foam on water): near-white pixels have a
+        # high minimum channel, so thresholding min(B,G,R) matches the old
+        # low-saturation/high-value HSV mask without the BGR2HSV conversion.
+        b, g, r = cv2.split(water_region)
+        min_channel = cv2.min(cv2.min(b, g), r, dst=buffers["min_channel"])
+        _, whitecap_mask = cv2.threshold(
+            min_channel, 200, 255, cv2.THRESH_BINARY, dst=buffers["whitecap_mask"]
+        )
         whitecap_pixels = cv2.countNonZero(whitecap_mask)
-        whitecap_ratio = whitecap_pixels / total_pixels if total_pixels > 0 else 0
 
-        # Edge detection for wave structure
-        gray_water = cv2.cvtColor(water_region, cv2.COLOR_BGR2GRAY)
-        gray_water = cv2.GaussianBlur(gray_water, (5, 5), 0)
+        # Edge detection for wave structure (reuse the shared grayscale).
+        # pyrDown's built-in Gaussian filtering replaces the separate blur
+        # pass, and Canny cost drops ~4x on the half-resolution region.
+        gray_water = gray[int(h * 0.4):, :]
+        water_small = cv2.pyrDown(gray_water, dst=buffers["water_small"])
         edges = cv2.Canny(
-            gray_water,
+            water_small,
             self._s.wave_canny_threshold_low,
             self._s.wave_canny_threshold_high,
+            edges=buffers["edges"],
         )
         edge_pixels = cv2.countNonZero(edges)
-        edge_density = edge_pixels / total_pixels if total_pixels > 0 else 0
-
-        wave_metric = whitecap_ratio * 0.6 + edge_density * 0.4
 
-        if wave_metric < 0.01:
-            level = "flat"
-        elif wave_metric < 0.03:
-            level = "small"
-        elif wave_metric < 0.06:
-            level = "medium"
-        elif wave_metric < 0.10:
-            level = "large"
-        else:
-            level = "heavy"
-
-        confidence = min(0.8, 0.4 + wave_metric * 5)
+        # Edges are 1-px curves, so pyrDown roughly halves the edge count
+        # while shrinking the region 4x. Scale both back to full resolution
+        # so edge_density stays on the original threshold calibration.
+        level, whitecap_ratio, edge_density, confidence = _wave_stats(
+            whitecap_pixels, whitecap_mask.size, edge_pixels * 2, edges.size * 4
+        )
 
-        return WaveEstimate(
-            wave_level=level,
+        return WaveEstimate.model_construct(
+            wave_level=_WAVE_LEVELS[level],
             whitecap_ratio=round(whitecap_ratio, 4),
             edge_density=round(edge_density, 4),
             confidence=round(confidence, 2),
         )
 
-    def _assess_quality(self, img: np.ndarray) -> ImageQuality:
-        """Assess if the image is usable for analysis."""
-        issues: list[str] = []
-        h, w = img.shape[:2]
-
-        if h < 100 or w < 100:
-            issues.append("too_small")
+    def _assess_quality(
+        self,
+        src_h: int,
+        src_w: int,
+        gray: np.ndarray,
+        mean_brightness: float,
+        std_dev: float,
+    ) -> ImageQuality:
+        """Assess if the image is usable for analysis.
+
+        src_h/src_w are the decoded frame's dimensions before downsampling,
+        so ultra-wide panoramas aren't misjudged by their shrunken height.
+        """
+        bits = 0
+        if src_h < 100 or src_w < 100:
+            bits |= 1  # too_small
 
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        mean_brightness = float(np.mean(gray))
         if mean_brightness < 20:
-            issues.append("too_dark")
-
-        lap_var = float(cv2.Laplacian(gray, cv2.CV_64F).var())
+            bits |= 2  # too_dark
+
+        # CV_16S keeps the Laplacian intermediate at 2 bytes/pixel instead of
+        # the 8 bytes/pixel a CV_64F buffer would need, for the same variance.
+        # Default ksize=1 aperture: its responses fit CV_16S and match the
+        # calibration of the variance threshold below.
+        lap = cv2.Laplacian(gray, cv2.CV_16S)
+        _, lap_std = cv2.meanStdDev(lap)
+        lap_var = float(lap_std[0, 0]) ** 2
         if lap_var < 10:
-            issues.append("too_blurry")
-
-        if float(np.std(gray)) < 5:
-            issues.append("solid_color")
-
-        is_usable = len(issues) == 0
-        score = 1.0
-        if "too_dark" in issues:
-            score -= 0.4
-        if "too_blurry" in issues:
-            score -= 0.3
-        if "solid_color" in issues:
-            score -= 0.5
-        if "too_small" in issues:
-            score -= 0.3
-        score = max(0.0, score)
-
-        return ImageQuality(is_usable=is_usable, quality_score=round(score, 2), issues=issues)
+            bits |= 4  # too_blurry
+
+        if std_dev < 5:
+            bits |= 8  # solid_color
+
+        return ImageQuality.model_construct(
+            is_usable=bits == 0,
+            quality_score=_SCORE_TABLE[bits],
+            issues=list(_ISSUE_TABLE[bits]),
+        )
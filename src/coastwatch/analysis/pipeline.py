@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 
+import cv2
+import numpy as np
+
+from coastwatch.analysis.decode import decode_bgr
 from coastwatch.analysis.models import (
     LocalAnalysisResult,
     PersonDetectionResult,
@@ -22,6 +27,47 @@ from coastwatch.storage.repository import Observation
 
 logger = logging.getLogger(__name__)
 
+# Observation column -> PersonDetectionResult attribute
+_PERSON_FIELD_MAP = {
+    "person_count": "person_count",
+    "person_confidence": "confidence_avg",
+    "detection_method": "detection_method",
+}
+
+# WeatherAPIData attributes; the Observation column is "weather_" + name
+_WEATHER_FIELDS = (
+    "temperature_c", "feels_like_c", "humidity_pct",
+    "wind_speed_kmh", "wind_direction", "wind_gust_kmh",
+    "condition", "description", "precipitation_mm",
+    "visibility_km", "uv_index",
+)
+
+# Observation column -> (VisionAnalysis section, attribute)
+_VISION_FIELD_MAP = {
+    "ai_crowd_level": ("crowd", "level"),
+    "ai_crowd_count": ("crowd", "estimated_count"),
+    "ai_crowd_distribution": ("crowd", "distribution"),
+    "ai_crowd_notes": ("crowd", "notes"),
+    "ai_wave_size": ("waves", "size"),
+    "ai_wave_quality": ("waves", "quality"),
+    "ai_wave_type": ("waves", "type"),
+    "ai_wave_period": ("waves", "period_estimate"),
+    "ai_wave_notes": ("waves", "notes"),
+    "ai_weather_condition": ("weather", "condition"),
+    "ai_wind_estimate": ("weather", "wind_estimate"),
+    "ai_wind_direction": ("weather", "wind_direction_visual"),
+    "ai_visibility": ("weather", "visibility"),
+    "ai_weather_notes": ("weather", "notes"),
+    "ai_current_danger_level": ("currents", "danger_level"),
+    "ai_current_rip_detected": ("currents", "rip_current_detected"),
+    "ai_current_indicators": ("currents", "indicators"),
+    "ai_current_notes": ("currents", "notes"),
+    "ai_beach_score": ("overall", "beach_score"),
+    "ai_surf_score": ("overall", "surf_score"),
+    "ai_summary": ("overall", "summary"),
+    "ai_best_for": ("overall", "best_for"),
+}
+
 
 class AnalysisPipeline:
     """Orchestrates person detection, image analysis, weather, and Claude Vision."""
@@ -37,6 +83,33 @@ class AnalysisPipeline:
         self._person_detector = person_detector
         self._weather_client = weather_client
         self._vision = vision_client
+        # Camera-level parallelism comes from the asyncio thread pool (one
+        # full frame per worker); stop OpenCV's internal thread pool from
+        # oversubscribing cores on top of that.
+        cv2.setNumThreads(1)
+        # YOLO shares one model (and at most one GPU), so detection calls
+        # serialize even when frames are processed concurrently.
+        self._gpu_sem = asyncio.Semaphore(1)
+
+    async def process_frames(
+        self,
+        items: list[tuple[GrabbedFrame, BeachConfig]],
+        *,
+        use_ai: bool = True,
+        max_concurrency: int = 8,
+    ) -> list[Observation]:
+        """Process several frames concurrently with bounded parallelism.
+
+        Image analysis and weather fetches overlap across beaches; YOLO
+        stays serialized via the shared detector semaphore.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(frame: GrabbedFrame, beach: BeachConfig) -> Observation:
+            async with sem:
+                return await self.process_frame(frame, beach, use_ai=use_ai)
+
+        return await asyncio.gather(*(_one(f, b) for f, b in items))
 
     async def process_frame(
         self,
@@ -45,11 +118,38 @@ class AnalysisPipeline:
         use_ai: bool = True,
     ) -> Observation:
         """Full analysis pipeline for a single frame."""
-        start = time.monotonic()
+        start_ns = time.perf_counter_ns()
 
-        # Step 1: Image analysis (waves + camera status)
-        local_result = self._image_analyzer.analyze(
-            frame.image_bytes,
+        # Weather fetch is network-bound and independent of the image, so it
+        # runs concurrently with the CPU-bound image analysis and YOLO stages.
+        weather_task: asyncio.Task | None = None
+        if self._weather_client:
+            weather_task = asyncio.create_task(
+                self._weather_client.get_weather(
+                    beach.coordinates.latitude,
+                    beach.coordinates.longitude,
+                    beach_id=beach.id,
+                )
+            )
+
+        # When YOLO will also run, decode the JPEG once up front and share
+        # the pixel buffer between image analysis and person detection;
+        # skip the decode entirely at night (the analyzer's solar gate).
+        image: bytes | np.ndarray = frame.image_bytes
+        if self._person_detector and not self._image_analyzer.is_night(
+            beach.coordinates.latitude,
+            beach.coordinates.longitude,
+            beach.metadata.timezone,
+        ):
+            decoded = await asyncio.to_thread(decode_bgr, frame.image_bytes)
+            if decoded is not None:
+                image = decoded
+
+        # Step 1: Image analysis (waves + camera status) — run in a worker
+        # thread so the CPU-bound OpenCV work doesn't block the event loop.
+        local_result = await asyncio.to_thread(
+            self._image_analyzer.analyze,
+            image,
             latitude=beach.coordinates.latitude,
             longitude=beach.coordinates.longitude,
             timezone=beach.metadata.timezone,
@@ -66,20 +166,17 @@ class AnalysisPipeline:
         person_result: PersonDetectionResult | None = None
         if self._person_detector and local_result.camera_status.status == "working":
             try:
-                person_result = self._person_detector.detect(frame.image_bytes)
+                async with self._gpu_sem:
+                    person_result = await asyncio.to_thread(self._person_detector.detect, image)
                 logger.info("%s YOLO: %d person(s)", beach.id, person_result.person_count)
             except Exception as e:
                 logger.error("%s YOLO failed: %s", beach.id, e)
 
-        # Step 3: Weather API (always, independent of image)
+        # Step 3: Weather API (started above, independent of image)
         weather_data: WeatherAPIData | None = None
-        if self._weather_client:
+        if weather_task:
             try:
-                weather_data = self._weather_client.get_weather(
-                    beach.coordinates.latitude,
-                    beach.coordinates.longitude,
-                    beach_id=beach.id,
-                )
+                weather_data = await weather_task
             except WeatherAPIError as e:
                 logger.warning("%s weather: %s", beach.id, e)
             except Exception as e:
@@ -90,40 +187,41 @@ class AnalysisPipeline:
         error_message: str | None = None
         model_used: str | None = None
 
-        if (use_ai and self._vision
-                and local_result.camera_status.status == "working"
-                and local_result.image_quality.is_usable):
-            try:
-                vision_result = await self._vision.analyze_frame(
-                    frame.image_bytes, beach,
-                    person_result=person_result,
-                    local_result=local_result,
-                    weather_data=weather_data,
-                )
-                model_used = self._vision._settings.model
-                logger.info(
-                    "%s AI: score=%.1f currents=%s summary=%s",
-                    beach.id,
-                    vision_result.overall.beach_score,
-                    vision_result.currents.danger_level,
-                    vision_result.overall.summary[:80],
-                )
-            except RateLimitError as e:
-                error_message = str(e)
-                logger.warning("%s: %s", beach.id, e)
-            except Exception as e:
-                error_message = str(e)
-                logger.error("%s AI failed: %s", beach.id, e)
-        elif (use_ai and self._vision
-              and local_result.camera_status.status != "working"):
-            error_message = f"Camera {local_result.camera_status.status}: {local_result.camera_status.reason}"
-            logger.info("%s: skipping AI — %s", beach.id, error_message)
-        elif (use_ai and self._vision
-              and not local_result.image_quality.is_usable):
-            error_message = f"Image unusable: {local_result.image_quality.issues}"
-            logger.warning("%s: skipping AI — %s", beach.id, error_message)
-
-        elapsed_ms = int((time.monotonic() - start) * 1000)
+        if use_ai and self._vision:
+            camera_status = local_result.camera_status
+            skip_reason: str | None = None
+            if camera_status.status != "working":
+                skip_reason = f"Camera {camera_status.status}: {camera_status.reason}"
+            elif not local_result.image_quality.is_usable:
+                skip_reason = f"Image unusable: {local_result.image_quality.issues}"
+
+            if skip_reason:
+                error_message = skip_reason
+                logger.info("%s: skipping AI — %s", beach.id, skip_reason)
+            else:
+                try:
+                    vision_result = await self._vision.analyze_frame(
+                        frame, beach,
+                        person_result=person_result,
+                        local_result=local_result,
+                        weather_data=weather_data,
+                    )
+                    model_used = self._vision._settings.model
+                    logger.info(
+                        "%s AI: score=%.1f currents=%s summary=%s",
+                        beach.id,
+                        vision_result.overall.beach_score,
+                        vision_result.currents.danger_level,
+                        vision_result.overall.summary[:80],
+                    )
+                except RateLimitError as e:
+                    error_message = str(e)
+                    logger.warning("%s: %s", beach.id, e)
+                except Exception as e:
+                    error_message = str(e)
+                    logger.error("%s AI failed: %s", beach.id, e)
+
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         return self._merge_results(
             beach, frame, local_result, person_result, weather_data,
@@ -143,68 +241,44 @@ class AnalysisPipeline:
         error_message: str | None,
     ) -> Observation:
         """Merge all results into a single Observation."""
-        obs = Observation(
-            beach_id=beach.id,
-            captured_at=frame.captured_at,
-            source_url=frame.source_url,
+        fields: dict = {
+            "beach_id": beach.id,
+            "captured_at": frame.captured_at,
+            "source_url": frame.source_url,
             # Camera status
-            camera_status=local_result.camera_status.status,
-            camera_status_reason=local_result.camera_status.reason,
+            "camera_status": local_result.camera_status.status,
+            "camera_status_reason": local_result.camera_status.reason,
             # Waves
-            cv_wave_level=local_result.waves.wave_level,
-            cv_whitecap_ratio=local_result.waves.whitecap_ratio,
-            cv_edge_density=local_result.waves.edge_density,
-            cv_wave_confidence=local_result.waves.confidence,
-            cv_image_quality=local_result.image_quality.quality_score,
+            "cv_wave_level": local_result.waves.wave_level,
+            "cv_whitecap_ratio": local_result.waves.whitecap_ratio,
+            "cv_edge_density": local_result.waves.edge_density,
+            "cv_wave_confidence": local_result.waves.confidence,
+            "cv_image_quality": local_result.image_quality.quality_score,
             # Meta
-            analysis_model=model_used,
-            processing_time_ms=elapsed_ms,
-            error_message=error_message,
-        )
+            "analysis_model": model_used,
+            "processing_time_ms": elapsed_ms,
+            "error_message": error_message,
+        }
 
         # Person detection
         if person_result:
-            obs.person_count = person_result.person_count
-            obs.person_confidence = person_result.confidence_avg
-            obs.detection_method = person_result.detection_method
+            fields.update(
+                (column, getattr(person_result, attr))
+                for column, attr in _PERSON_FIELD_MAP.items()
+            )
 
         # Weather API
         if weather_data and weather_data.temperature_c is not None:
-            obs.weather_temperature_c = weather_data.temperature_c
-            obs.weather_feels_like_c = weather_data.feels_like_c
-            obs.weather_humidity_pct = weather_data.humidity_pct
-            obs.weather_wind_speed_kmh = weather_data.wind_speed_kmh
-            obs.weather_wind_direction = weather_data.wind_direction
-            obs.weather_wind_gust_kmh = weather_data.wind_gust_kmh
-            obs.weather_condition = weather_data.condition
-            obs.weather_description = weather_data.description
-            obs.weather_precipitation_mm = weather_data.precipitation_mm
-            obs.weather_visibility_km = weather_data.visibility_km
-            obs.weather_uv_index = weather_data.uv_index
+            fields.update(
+                (f"weather_{name}", getattr(weather_data, name))
+                for name in _WEATHER_FIELDS
+            )
 
         # Claude Vision
         if vision_result:
-            obs.ai_crowd_level = vision_result.crowd.level
-            obs.ai_crowd_count = vision_result.crowd.estimated_count
-            obs.ai_crowd_distribution = vision_result.crowd.distribution
-            obs.ai_crowd_notes = vision_result.crowd.notes
-            obs.ai_wave_size = vision_result.waves.size
-            obs.ai_wave_quality = vision_result.waves.quality
-            obs.ai_wave_type = vision_result.waves.type
-            obs.ai_wave_period = vision_result.waves.period_estimate
-            obs.ai_wave_notes = vision_result.waves.notes
-            obs.ai_weather_condition = vision_result.weather.condition
-            obs.ai_wind_estimate = vision_result.weather.wind_estimate
-            obs.ai_wind_direction = vision_result.weather.wind_direction_visual
-            obs.ai_visibility = vision_result.weather.visibility
-            obs.ai_weather_notes = vision_result.weather.notes
-            obs.ai_current_danger_level = vision_result.currents.danger_level
-            obs.ai_current_rip_detected = vision_result.currents.rip_current_detected
-            obs.ai_current_indicators = vision_result.currents.indicators
-            obs.ai_current_notes = vision_result.currents.notes
-            obs.ai_beach_score = vision_result.overall.beach_score
-            obs.ai_surf_score = vision_result.overall.surf_score
-            obs.ai_summary = vision_result.overall.summary
-            obs.ai_best_for = vision_result.overall.best_for
-
-        return obs
+            fields.update(
+                (column, getattr(getattr(vision_result, section), attr))
+                for column, (section, attr) in _VISION_FIELD_MAP.items()
+            )
+
+        return Observation(**fields)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import base64
-import json
 import logging
-import re
+from io import BytesIO
 
 import anthropic
+from PIL import Image
+from pydantic import TypeAdapter, ValidationError
 
 from coastwatch.analysis.models import (
     LocalAnalysisResult,
@@ -15,12 +15,49 @@ from coastwatch.analysis.models import (
     VisionAnalysis,
     WeatherAPIData,
 )
+from coastwatch.capture.grabber import GrabbedFrame
 from coastwatch.common.exceptions import VisionAnalysisError, VisionParseError
 from coastwatch.common.rate_limiter import TokenBucketRateLimiter
 from coastwatch.config.models import BeachConfig, ClaudeSettings
 
 logger = logging.getLogger(__name__)
 
+# Fuses JSON parsing and schema validation in pydantic-core; built once
+# since TypeAdapter construction compiles the schema.
+_VISION_ADAPTER = TypeAdapter(VisionAnalysis)
+
+# Claude rescales images above 1568px server-side anyway; shrinking client
+# side cuts upload bytes, input tokens, and model latency for HD webcams.
+MAX_VISION_DIM = 1568
+
+# One async client shared by every VisionClient: API calls no longer block
+# the event loop, and all beaches reuse the same connection pool and TLS
+# session instead of building one per instance. Lazy so importing this
+# module never requires ANTHROPIC_API_KEY to be set.
+_client: anthropic.AsyncAnthropic | None = None
+
+
+def _get_client() -> anthropic.AsyncAnthropic:
+    global _client
+    if _client is None:
+        _client = anthropic.AsyncAnthropic(max_retries=2, timeout=60.0)
+    return _client
+
+
+def _shrink_image(image_bytes: bytes) -> bytes:
+    """Downscale the frame for the Vision API if it exceeds MAX_VISION_DIM."""
+    try:
+        img = Image.open(BytesIO(image_bytes))
+        if max(img.size) <= MAX_VISION_DIM:
+            return image_bytes
+        img.thumbnail((MAX_VISION_DIM, MAX_VISION_DIM), Image.Resampling.LANCZOS)
+        buf = BytesIO()
+        img.convert("RGB").save(buf, format="JPEG", quality=85)
+        return buf.getvalue()
+    except Exception as e:
+        logger.debug("Image downscale failed, sending original: %s", e)
+        return image_bytes
+
 SYSTEM_PROMPT = """You are a coastal conditions analyst specializing in French Atlantic beaches. You analyze webcam images to provide structured reports on beach conditions, including dangerous rip current detection (courants de baïne).
 
 You will receive:
@@ -75,18 +112,25 @@ If the image shows low tide with exposed sandbars or a receding tide, increase v
 
 Respond ONLY with valid JSON. No markdown, no commentary outside the JSON."""
 
+# Static tail of the per-frame context message, built once.
+_CONTEXT_FOOTER = (
+    "",
+    "Analyze this image and return the JSON report. "
+    "Pay special attention to rip current indicators.",
+)
+
 
 class VisionClient:
     """Sends beach webcam frames to Claude Vision API for analysis."""
 
     def __init__(self, settings: ClaudeSettings, rate_limiter: TokenBucketRateLimiter):
-        self._client = anthropic.Anthropic()
+        self._client = _get_client()
         self._settings = settings
         self._rate_limiter = rate_limiter
 
     async def analyze_frame(
         self,
-        image_bytes: bytes,
+        frame: GrabbedFrame,
         beach: BeachConfig,
         person_result: PersonDetectionResult | None = None,
         local_result: LocalAnalysisResult | None = None,
@@ -95,7 +139,7 @@ class VisionClient:
         """Send frame to Claude Vision API with structured prompt."""
         await self._rate_limiter.acquire()
 
-        image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+        image_b64 = frame.as_base64(_shrink_image)
 
         # Build context with all available data
         lines = [
@@ -117,9 +161,11 @@ class VisionClient:
         if weather_data and weather_data.temperature_c is not None:
             lines.append("")
             lines.append("Real weather data (OpenWeatherMap):")
-            lines.append(f"  Temperature: {weather_data.temperature_c:.1f}°C "
-                         f"(feels like {weather_data.feels_like_c:.1f}°C)" if weather_data.feels_like_c else
-                         f"  Temperature: {weather_data.temperature_c:.1f}°C")
+            if weather_data.feels_like_c is not None:
+                lines.append(f"  Temperature: {weather_data.temperature_c:.1f}°C "
+                             f"(feels like {weather_data.feels_like_c:.1f}°C)")
+            else:
+                lines.append(f"  Temperature: {weather_data.temperature_c:.1f}°C")
             lines.append(f"  Condition: {weather_data.condition} — {weather_data.description}")
             lines.append(f"  Wind: {weather_data.wind_speed_kmh:.0f} km/h {weather_data.wind_direction or '?'}"
                          + (f" (gusts {weather_data.wind_gust_kmh:.0f} km/h)" if weather_data.wind_gust_kmh else ""))
@@ -129,17 +175,24 @@ class VisionClient:
             if weather_data.visibility_km is not None:
                 lines.append(f"  Visibility: {weather_data.visibility_km:.0f} km")
 
-        lines.append("")
-        lines.append("Analyze this image and return the JSON report. "
-                      "Pay special attention to rip current indicators.")
+        lines.extend(_CONTEXT_FOOTER)
 
         context_text = "\n".join(lines)
 
         try:
-            response = self._client.messages.create(
+            response = await self._client.messages.create(
                 model=self._settings.model,
                 max_tokens=self._settings.max_tokens,
-                system=SYSTEM_PROMPT,
+                # The system prompt is identical for every beach and frame;
+                # marking it cacheable lets the API serve the prefix from its
+                # prompt cache across the capture cycle (cheaper + faster).
+                system=[
+                    {
+                        "type": "text",
+                        "text": SYSTEM_PROMPT,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
                 messages=[
                     {
                         "role": "user",
@@ -169,16 +222,18 @@ class VisionClient:
 
     def _parse_response(self, raw_text: str) -> VisionAnalysis:
         """Parse Claude's JSON response into VisionAnalysis."""
+        # Strip an optional markdown code fence with plain string ops; no
+        # regex engine needed for a prefix/suffix check.
         text = raw_text.strip()
-        text = re.sub(r"^```(?:json)?\s*", "", text)
-        text = re.sub(r"\s*```$", "", text)
-
-        try:
-            data = json.loads(text)
-        except json.JSONDecodeError as e:
-            raise VisionParseError(f"Invalid JSON from Claude: {e}\nRaw: {text[:500]}")
+        if text.startswith("```"):
+            text = text[3:]
+            if text.startswith("json"):
+                text = text[4:]
+            text = text.lstrip()
+        if text.endswith("```"):
+            text = text[:-3].rstrip()
 
         try:
-            return VisionAnalysis(**data)
-        except Exception as e:
-            raise VisionParseError(f"Invalid schema from Claude: {e}")
+            return _VISION_ADAPTER.validate_json(text)
+        except ValidationError as e:
+            raise VisionParseError(f"Invalid response from Claude: {e}\nRaw: {text[:500]}")
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import time
+from collections import OrderedDict
 
 import httpx
 
@@ -16,34 +18,36 @@ logger = logging.getLogger(__name__)
 
 OWM_BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
 
-# Map OWM condition IDs to our condition strings
-_CONDITION_MAP = {
-    range(200, 300): "storm",
-    range(300, 400): "rain",
-    range(500, 600): "rain",
-    range(600, 700): "snow",
-    range(700, 800): "fog",
-}
+# Bound the weather cache so long daemon runs can't grow it without limit;
+# 256 coordinates is far beyond any realistic beach roster.
+_CACHE_MAX_ENTRIES = 256
+
+# Entries older than the soft TTL (cache_ttl_sec) but younger than this
+# multiple of it are served stale while one background refresh runs, so all
+# beaches don't stampede the OWM API the moment a TTL expires.
+_HARD_TTL_FACTOR = 3
+
+# OWM condition IDs group by their hundreds digit (2xx storm, 3xx/5xx rain,
+# 6xx snow, 7xx fog); only the 8xx clouds series needs finer splitting.
+_HUNDREDS = ("unknown", "unknown", "storm", "rain", "unknown",
+             "rain", "snow", "fog", "special", "unknown")
 
 
 def _owm_id_to_condition(weather_id: int) -> str:
-    if weather_id == 800:
-        return "clear"
-    if 801 <= weather_id <= 802:
-        return "partly_cloudy"
-    if 803 <= weather_id <= 804:
-        return "overcast"
-    for id_range, condition in _CONDITION_MAP.items():
-        if weather_id in id_range:
-            return condition
-    return "unknown"
+    hundreds = weather_id // 100
+    if hundreds == 8:
+        if weather_id == 800:
+            return "clear"
+        return "partly_cloudy" if weather_id <= 802 else "overcast"
+    return _HUNDREDS[hundreds] if 0 <= hundreds < 10 else "unknown"
+
+
+_COMPASS_DIRS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
+                 "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
 
 
 def _degrees_to_direction(deg: float) -> str:
-    dirs = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-            "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    idx = round(deg / 22.5) % 16
-    return dirs[idx]
+    return _COMPASS_DIRS[round(deg / 22.5) % 16]
 
 
 class WeatherClient:
@@ -52,25 +56,77 @@ class WeatherClient:
     def __init__(self, settings: WeatherAPISettings | None = None):
         self._s = settings or WeatherAPISettings()
         self._api_key = os.environ.get("OPENWEATHERMAP_API_KEY", "")
-        self._cache: dict[str, tuple[float, WeatherAPIData]] = {}
+        self._cache: OrderedDict[str, tuple[int, WeatherAPIData]] = OrderedDict()
+        self._client: httpx.AsyncClient | None = None
+        self._refreshing: set[str] = set()
+        # Strong references to in-flight refresh tasks; without them the
+        # event loop may garbage-collect a task before it completes.
+        self._refresh_tasks: set[asyncio.Task] = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared client so TLS/TCP connections are reused."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            )
+        return self._client
 
-    def get_weather(self, latitude: float, longitude: float, beach_id: str = "") -> WeatherAPIData:
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_weather(self, latitude: float, longitude: float, beach_id: str = "") -> WeatherAPIData:
         """Fetch current weather for coordinates. Uses cache with TTL."""
         cache_key = f"{latitude:.4f},{longitude:.4f}"
-
-        # Check cache
-        if cache_key in self._cache:
-            ts, cached_data = self._cache[cache_key]
-            if time.monotonic() - ts < self._s.cache_ttl_sec:
+        soft_ttl_ns = self._s.cache_ttl_sec * 1_000_000_000
+
+        # Check cache (LRU: refresh recency on hit, drop entries past the
+        # hard TTL; between soft and hard TTL serve stale and revalidate in
+        # the background so one refresh covers all concurrent callers).
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            ts, cached_data = cached
+            age_ns = time.monotonic_ns() - ts
+            if age_ns < soft_ttl_ns:
+                self._cache.move_to_end(cache_key)
                 logger.debug("Weather cache hit for %s", beach_id or cache_key)
                 return cached_data
+            if age_ns < soft_ttl_ns * _HARD_TTL_FACTOR:
+                self._cache.move_to_end(cache_key)
+                if cache_key not in self._refreshing:
+                    self._refreshing.add(cache_key)
+                    task = asyncio.create_task(self._refresh(cache_key, latitude, longitude, beach_id))
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._refresh_tasks.discard)
+                logger.debug("Weather cache stale for %s, refreshing in background", beach_id or cache_key)
+                return cached_data
+            del self._cache[cache_key]
 
+        return await self._fetch(cache_key, latitude, longitude, beach_id)
+
+    async def _refresh(self, cache_key: str, latitude: float, longitude: float, beach_id: str) -> None:
+        """Background revalidation of a stale cache entry."""
+        try:
+            await self._fetch(cache_key, latitude, longitude, beach_id)
+        except Exception as e:
+            # Nothing awaits this task, so any escaping exception (not just
+            # WeatherAPIError — e.g. a malformed JSON body) would surface as
+            # "Task exception was never retrieved" noise.
+            logger.warning("Background weather refresh failed for %s: %s", beach_id or cache_key, e)
+        finally:
+            self._refreshing.discard(cache_key)
+
+    async def _fetch(self, cache_key: str, latitude: float, longitude: float, beach_id: str) -> WeatherAPIData:
+        """Fetch from the OWM API and store the result in the cache."""
         if not self._api_key:
             logger.warning("OPENWEATHERMAP_API_KEY not set, returning empty weather data")
             return WeatherAPIData()
 
         try:
-            resp = httpx.get(
+            resp = await self._get_client().get(
                 OWM_BASE_URL,
                 params={
                     "lat": latitude,
@@ -78,7 +134,6 @@ class WeatherClient:
                     "appid": self._api_key,
                     "units": "metric",
                 },
-                timeout=10.0,
             )
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
@@ -108,8 +163,11 @@ class WeatherClient:
             uv_index=None,  # not available in free tier
         )
 
-        # Cache the result
-        self._cache[cache_key] = (time.monotonic(), result)
+        # Cache the result, evicting the least recently used on overflow
+        self._cache[cache_key] = (time.monotonic_ns(), result)
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
         logger.debug("Weather for %s: %s %.1f°C wind %.0fkm/h %s",
                       beach_id or cache_key, result.condition,
                       result.temperature_c or 0, result.wind_speed_kmh or 0,
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import base64
 import logging
 import os
-from dataclasses import dataclass
+import random
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Callable
 
 import httpx
 
@@ -17,6 +21,16 @@ logger = logging.getLogger(__name__)
 
 WINDY_API_URL = "https://api.windy.com/webcams/api/v3/webcams"
 
+# Retry delays grow exponentially up to this cap; jitter spreads retries so
+# multiple daemons hitting the same throttled host don't resynchronize.
+_MAX_RETRY_DELAY = 60.0
+_RETRY_JITTER = 0.25
+
+# Windy metadata cache: serve entries up to _WINDY_META_MAX_AGE directly,
+# then stale-while-revalidate for _WINDY_META_SWR before refetching inline.
+_WINDY_META_MAX_AGE = 300.0
+_WINDY_META_SWR = 1800.0
+
 
 @dataclass
 class GrabbedFrame:
@@ -25,6 +39,18 @@ class GrabbedFrame:
     captured_at: str  # ISO 8601 UTC
     source_url: str
     content_type: str = "image/jpeg"
+    _image_b64: str | None = field(default=None, repr=False)
+
+    def as_base64(self, transform: Callable[[bytes], bytes] | None = None) -> str:
+        """Base64-encode the frame once; reused across Vision calls/retries.
+
+        An optional transform (e.g. downscaling for the Vision API) is
+        applied to the raw bytes before encoding, on first use only.
+        """
+        if self._image_b64 is None:
+            payload = transform(self.image_bytes) if transform else self.image_bytes
+            self._image_b64 = base64.b64encode(payload).decode("ascii")
+        return self._image_b64
 
 
 @dataclass
@@ -41,105 +67,275 @@ class GrabResult:
 class FrameGrabber:
     """Fetches single frames from webcam snapshot URLs."""
 
-    def __init__(self, timeout: float = 15.0, max_retries: int = 3, backoff: float = 5.0):
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        max_retries: int = 3,
+        backoff: float = 5.0,
+        hedge_delay: float = 2.0,
+        concurrency: int = 4,
+    ):
         self._timeout = timeout
         self._max_retries = max_retries
         self._backoff = backoff
+        self._hedge_delay = hedge_delay
+        self._concurrency = concurrency
         self._windy_api_key = os.environ.get("WINDY_API_KEY", "")
+        # Built once: the daemon loop would otherwise allocate these dicts
+        # per beach per cycle.
+        self._windy_headers = {"X-WINDY-API-KEY": self._windy_api_key}
+        self._windy_params = {"include": "images"}
+        self._client: httpx.AsyncClient | None = None
+        self._windy_cache: dict[str, tuple[float, str]] = {}
+        self._windy_refreshing: set[str] = set()
+        # Strong references to in-flight refresh tasks; without them the
+        # event loop may garbage-collect a task before it completes.
+        self._windy_tasks: set[asyncio.Task] = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the shared client; reuses DNS, TLS, and HTTP/2
+        connections across beaches and capture cycles."""
+        if self._client is None:
+            # Pool sized from the grab concurrency (plus headroom for hedged
+            # fallbacks) instead of httpx's 100-connection default.
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=max(self._concurrency * 2, 16),
+                    max_keepalive_connections=max(self._concurrency, 8),
+                    keepalive_expiry=60.0,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def grab_frame(self, beach: BeachConfig) -> GrabbedFrame:
-        """Fetch a single frame from the beach webcam."""
-        url = beach.webcam.snapshot_url
-        urls_tried: list[str] = []
+        """Fetch a single frame from the beach webcam.
 
-        all_urls = [url] + beach.webcam.fallback_urls
+        Fallback URLs are hedged: each gets launched after the previous
+        attempt has had a short head start, and the first success wins,
+        so a slow primary no longer delays fallbacks by its full timeout.
+        """
+        urls_tried: list[str] = []
+        all_urls = [beach.webcam.snapshot_url] + beach.webcam.fallback_urls
         last_error: Exception | None = None
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            for attempt_url in all_urls:
+        client = self._get_client()
+        pending: set[asyncio.Task] = set()
+        task_urls: dict[asyncio.Task, str] = {}
+
+        try:
+            for i, attempt_url in enumerate(all_urls):
                 urls_tried.append(attempt_url)
-                try:
-                    image_bytes = await self._fetch_url(client, attempt_url, beach)
-                    return GrabbedFrame(
-                        beach_id=beach.id,
-                        image_bytes=image_bytes,
-                        captured_at=datetime.now(timezone.utc).isoformat(),
-                        source_url=attempt_url,
+                task = asyncio.create_task(self._fetch_url(client, attempt_url, beach))
+                task_urls[task] = attempt_url
+                pending.add(task)
+                is_last = i == len(all_urls) - 1
+
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending,
+                        timeout=None if is_last else self._hedge_delay,
+                        return_when=asyncio.FIRST_COMPLETED,
                     )
-                except Exception as e:
-                    last_error = e
-                    logger.warning("Failed to grab %s from %s: %s", beach.id, attempt_url, e)
+                    if not done:
+                        # Hedge window expired — launch the next fallback
+                        # while the in-flight attempts keep running.
+                        break
+                    for task in done:
+                        try:
+                            image_bytes = task.result()
+                        except Exception as e:
+                            last_error = e
+                            logger.warning("Failed to grab %s from %s: %s",
+                                           beach.id, task_urls[task], e)
+                        else:
+                            return GrabbedFrame(
+                                beach_id=beach.id,
+                                image_bytes=image_bytes,
+                                captured_at=datetime.now(timezone.utc).isoformat(),
+                                source_url=task_urls[task],
+                            )
+        finally:
+            for task in pending:
+                task.cancel()
 
         raise WebcamUnavailableError(beach.id, urls_tried, last_error)
 
+    async def _sleep_for_retry(self, attempt: int, response: httpx.Response | None = None) -> None:
+        """Back off exponentially with jitter; honors Retry-After on 429/503."""
+        delay = min(_MAX_RETRY_DELAY, self._backoff * 2 ** attempt)
+        delay *= 1 + random.uniform(0, _RETRY_JITTER)
+        if response is not None and response.status_code in (429, 503):
+            try:
+                delay = float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                pass
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    async def _read_body(resp: httpx.Response) -> bytes:
+        """Accumulate a streamed response body in fixed-size chunks.
+
+        Keeps peak allocations to 64KiB steps instead of one response-sized
+        spike per concurrent grab.
+        """
+        buf = bytearray()
+        async for chunk in resp.aiter_bytes(chunk_size=65536):
+            buf += chunk
+        return bytes(buf)
+
     async def _fetch_url(self, client: httpx.AsyncClient, url: str, beach: BeachConfig) -> bytes:
         """Fetch image bytes from a URL, handling Windy API protocol."""
         if url.startswith("windy://"):
             return await self._fetch_windy(client, url[8:])
 
-        headers = dict(beach.webcam.headers)
+        # httpx copies headers into its own structure; no defensive dict() needed
+        headers = beach.webcam.headers
         for attempt in range(self._max_retries):
             try:
-                resp = await client.get(url, headers=headers, follow_redirects=True)
-                resp.raise_for_status()
-                return resp.content
-            except httpx.HTTPError as e:
+                async with client.stream("GET", url, headers=headers, follow_redirects=True) as resp:
+                    resp.raise_for_status()
+                    return await self._read_body(resp)
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status < 500 and status not in (408, 429):
+                    # Permanent client error (404 dead URL, 401 bad auth...);
+                    # retrying just burns the backoff budget.
+                    raise
+                if attempt < self._max_retries - 1:
+                    await self._sleep_for_retry(attempt, e.response)
+                else:
+                    raise
+            except httpx.HTTPError:
                 if attempt < self._max_retries - 1:
-                    await asyncio.sleep(self._backoff * (attempt + 1))
+                    await self._sleep_for_retry(attempt)
                 else:
                     raise
 
         raise RuntimeError(f"Unreachable: all retries failed for {url}")
 
+    async def _fetch_windy_meta(self, client: httpx.AsyncClient, webcam_id: str) -> str:
+        """Fetch the current snapshot URL for a Windy webcam and cache it."""
+        api_url = f"{WINDY_API_URL}/{webcam_id}"
+        resp = await client.get(api_url, headers=self._windy_headers, params=self._windy_params)
+        resp.raise_for_status()
+        data = resp.json()
+
+        # Get the best available image URL
+        images = data.get("images", {})
+        current = images.get("current", {})
+        # Try preview first (larger), fall back to icon
+        image_url = current.get("preview") or current.get("icon") or current.get("thumbnail")
+        if not image_url:
+            raise RuntimeError(f"No image URL in Windy response for webcam {webcam_id}")
+
+        self._windy_cache[webcam_id] = (time.monotonic(), image_url)
+        return image_url
+
+    async def _refresh_windy_meta(self, client: httpx.AsyncClient, webcam_id: str) -> None:
+        """Background revalidation of a stale Windy metadata entry."""
+        try:
+            await self._fetch_windy_meta(client, webcam_id)
+        except Exception as e:
+            logger.debug("Windy metadata refresh failed for %s: %s", webcam_id, e)
+        finally:
+            self._windy_refreshing.discard(webcam_id)
+
+    def _cached_windy_url(self, client: httpx.AsyncClient, webcam_id: str) -> str | None:
+        """Return a cached snapshot URL, revalidating stale entries off-path."""
+        cached = self._windy_cache.get(webcam_id)
+        if cached is None:
+            return None
+        fetched_at, image_url = cached
+        age = time.monotonic() - fetched_at
+        if age < _WINDY_META_MAX_AGE:
+            return image_url
+        if age < _WINDY_META_MAX_AGE + _WINDY_META_SWR:
+            if webcam_id not in self._windy_refreshing:
+                self._windy_refreshing.add(webcam_id)
+                task = asyncio.create_task(self._refresh_windy_meta(client, webcam_id))
+                self._windy_tasks.add(task)
+                task.add_done_callback(self._windy_tasks.discard)
+            return image_url
+        del self._windy_cache[webcam_id]
+        return None
+
     async def _fetch_windy(self, client: httpx.AsyncClient, webcam_id: str) -> bytes:
         """Fetch snapshot via Windy Webcams API v3."""
         if not self._windy_api_key:
             raise RuntimeError("WINDY_API_KEY not set. Get a free key at https://api.windy.com/webcams")
 
-        api_url = f"{WINDY_API_URL}/{webcam_id}"
-        headers = {"X-WINDY-API-KEY": self._windy_api_key}
-        params = {"include": "images"}
-
         for attempt in range(self._max_retries):
+            from_cache = True
             try:
-                resp = await client.get(api_url, headers=headers, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-
-                # Get the best available image URL
-                images = data.get("images", {})
-                current = images.get("current", {})
-                # Try preview first (larger), fall back to icon
-                image_url = current.get("preview") or current.get("icon") or current.get("thumbnail")
-                if not image_url:
-                    raise RuntimeError(f"No image URL in Windy response for webcam {webcam_id}")
-
-                img_resp = await client.get(image_url, follow_redirects=True)
-                img_resp.raise_for_status()
-                return img_resp.content
-
-            except httpx.HTTPError as e:
+                # Metadata rarely changes between cycles: reuse the cached
+                # snapshot URL when fresh enough, halving requests per grab.
+                image_url = self._cached_windy_url(client, webcam_id)
+                if image_url is None:
+                    from_cache = False
+                    image_url = await self._fetch_windy_meta(client, webcam_id)
+
+                async with client.stream("GET", image_url, follow_redirects=True) as img_resp:
+                    img_resp.raise_for_status()
+                    return await self._read_body(img_resp)
+
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                permanent = status < 500 and status not in (408, 429)
+                if from_cache:
+                    # Windy rotates snapshot URLs server-side; a cached one
+                    # that starts failing would otherwise break every grab
+                    # until it ages out. Drop it so the next attempt goes
+                    # through fresh metadata.
+                    self._windy_cache.pop(webcam_id, None)
+                    if permanent and attempt < self._max_retries - 1:
+                        continue
+                if permanent:
+                    # Permanent client error (404 dead URL, 401 bad auth...);
+                    # retrying just burns the backoff budget.
+                    raise
+                if attempt < self._max_retries - 1:
+                    await self._sleep_for_retry(attempt, e.response)
+                else:
+                    raise
+            except httpx.HTTPError:
                 if attempt < self._max_retries - 1:
-                    await asyncio.sleep(self._backoff * (attempt + 1))
+                    await self._sleep_for_retry(attempt)
                 else:
                     raise
 
         raise RuntimeError(f"Unreachable: all retries failed for Windy webcam {webcam_id}")
 
+    async def _grab_one(self, beach: BeachConfig, semaphore: asyncio.Semaphore) -> GrabResult:
+        async with semaphore:
+            try:
+                frame = await self.grab_frame(beach)
+                return GrabResult(beach_id=beach.id, frame=frame)
+            except Exception as e:
+                logger.error("Capture failed for %s: %s", beach.id, e)
+                return GrabResult(beach_id=beach.id, error=e)
+
     async def grab_all(
-        self, beaches: list[BeachConfig], concurrency: int = 4
+        self, beaches: list[BeachConfig], concurrency: int | None = None
     ) -> list[GrabResult]:
         """Fetch frames from multiple beaches concurrently."""
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def _grab_one(beach: BeachConfig) -> GrabResult:
-            async with semaphore:
-                try:
-                    frame = await self.grab_frame(beach)
-                    return GrabResult(beach_id=beach.id, frame=frame)
-                except Exception as e:
-                    logger.error("Capture failed for %s: %s", beach.id, e)
-                    return GrabResult(beach_id=beach.id, error=e)
-
-        results = await asyncio.gather(*[_grab_one(b) for b in beaches])
+        semaphore = asyncio.Semaphore(concurrency or self._concurrency)
+        results = await asyncio.gather(*[self._grab_one(b, semaphore) for b in beaches])
         return list(results)
+
+    async def iter_grabbed(self, beaches: list[BeachConfig], concurrency: int | None = None):
+        """Yield GrabResults as captures finish, fastest beach first.
+
+        Lets callers start analyzing early frames while slower webcams are
+        still downloading, instead of waiting for the whole batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self._concurrency)
+        tasks = [asyncio.create_task(self._grab_one(b, semaphore)) for b in beaches]
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
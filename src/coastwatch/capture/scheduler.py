@@ -10,13 +10,18 @@ from pathlib import Path
 
 from coastwatch.analysis.pipeline import AnalysisPipeline
 from coastwatch.capture.grabber import FrameGrabber
+from coastwatch.common.beaches import beaches_by_id
 from coastwatch.config.models import BeachConfig
-from coastwatch.storage.repository import ObservationRepository
+from coastwatch.storage.repository import Observation, ObservationRepository
 
 logger = logging.getLogger(__name__)
 
 FRAMES_DIR = Path("~/.coastwatch/frames").expanduser()
 
+# Cap concurrent frame analyses so decoded pixel buffers stay bounded while
+# captures stream in.
+_MAX_INFLIGHT_ANALYSES = 4
+
 
 class CaptureScheduler:
     """Manages periodic capture-and-analyze cycles."""
@@ -35,7 +40,7 @@ class CaptureScheduler:
         self._pipeline = pipeline
         self._repo = repository
         self._default_interval = default_interval
-        self._running = False
+        self._stop_event = asyncio.Event()
         self._save_frames = save_frames
 
     def _save_frame(self, beach_id: str, image_bytes: bytes, captured_at: str) -> Path | None:
@@ -58,57 +63,87 @@ class CaptureScheduler:
         if beach_ids:
             beaches = [b for b in beaches if b.id in beach_ids]
 
-        results = await self._grabber.grab_all(beaches)
+        by_id = beaches_by_id(beaches)
         successful: list[str] = []
-
-        for result in results:
+        pending_obs: list[Observation] = []
+        analysis_sem = asyncio.Semaphore(_MAX_INFLIGHT_ANALYSES)
+
+        async def _process(result) -> None:
+            async with analysis_sem:
+                try:
+                    # Save frame to disk
+                    if self._save_frames:
+                        self._save_frame(result.beach_id, result.frame.image_bytes, result.frame.captured_at)
+
+                    obs = await self._pipeline.process_frame(result.frame, by_id[result.beach_id], use_ai=use_ai)
+                    pending_obs.append(obs)
+                    successful.append(result.beach_id)
+                    logger.info("Processed %s: score=%s", result.beach_id,
+                                obs.ai_beach_score or "N/A (OpenCV only)")
+                except Exception as e:
+                    logger.error("Analysis failed for %s: %s", result.beach_id, e)
+
+        # Analyze frames as captures land so CPU-bound analysis overlaps
+        # with still-pending downloads from slower webcams.
+        tasks: list[asyncio.Task] = []
+        async for result in self._grabber.iter_grabbed(beaches):
             if not result.success:
                 logger.warning("Skipping %s: capture failed", result.beach_id)
                 continue
+            tasks.append(asyncio.create_task(_process(result)))
 
-            beach = next(b for b in beaches if b.id == result.beach_id)
-            try:
-                # Save frame to disk
-                if self._save_frames:
-                    self._save_frame(result.beach_id, result.frame.image_bytes, result.frame.captured_at)
+        if tasks:
+            await asyncio.gather(*tasks)
 
-                obs = await self._pipeline.process_frame(result.frame, beach, use_ai=use_ai)
-                self._repo.save(obs)
-                successful.append(result.beach_id)
-                logger.info("Processed %s: score=%s", result.beach_id,
-                            obs.ai_beach_score or "N/A (OpenCV only)")
-            except Exception as e:
-                logger.error("Analysis failed for %s: %s", result.beach_id, e)
+        # One transaction for the whole cycle: N beaches, one fsync.
+        try:
+            self._repo.save_many(pending_obs)
+        except Exception as e:
+            logger.error("Batch save failed (%s); retrying row by row", e)
+            for obs in pending_obs:
+                try:
+                    self._repo.save(obs)
+                except Exception as row_error:
+                    logger.error("Save failed for %s: %s", obs.beach_id, row_error)
 
         return successful
 
     async def run_daemon(self, use_ai: bool = True) -> None:
         """Run continuous capture loop until interrupted."""
-        self._running = True
-        loop = asyncio.get_event_loop()
+        self._stop_event.clear()
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, self._stop)
 
         logger.info("Daemon started. Monitoring %d beaches every %ds",
                      len(self._beaches), self._default_interval)
 
-        while self._running:
-            start = time.monotonic()
-            try:
-                successful = await self.run_once(use_ai=use_ai)
-                logger.info("Cycle complete: %d/%d beaches OK",
-                            len(successful), len(self._beaches))
-            except Exception as e:
-                logger.error("Capture cycle error: %s", e)
-
-            elapsed = time.monotonic() - start
-            sleep_time = max(0, self._default_interval - elapsed)
-            if self._running and sleep_time > 0:
-                logger.debug("Sleeping %.0fs until next cycle", sleep_time)
-                await asyncio.sleep(sleep_time)
+        try:
+            while not self._stop_event.is_set():
+                start = time.monotonic()
+                try:
+                    successful = await self.run_once(use_ai=use_ai)
+                    logger.info("Cycle complete: %d/%d beaches OK",
+                                len(successful), len(self._beaches))
+                except Exception as e:
+                    logger.error("Capture cycle error: %s", e)
+
+                elapsed = time.monotonic() - start
+                sleep_time = max(0, self._default_interval - elapsed)
+                if sleep_time > 0 and not self._stop_event.is_set():
+                    logger.debug("Sleeping %.0fs until next cycle", sleep_time)
+                    try:
+                        # Racing the sleep against the stop event makes
+                        # Ctrl-C take effect immediately instead of after
+                        # up to a full interval.
+                        await asyncio.wait_for(self._stop_event.wait(), timeout=sleep_time)
+                    except TimeoutError:
+                        pass
+        finally:
+            await self._grabber.aclose()
 
         logger.info("Daemon stopped.")
 
     def _stop(self) -> None:
         logger.info("Shutdown signal received")
-        self._running = False
+        self._stop_event.set()
@@ -0,0 +1,9 @@
+"""BAYWATCH command-line interface."""
+
+from __future__ import annotations
+
+from rich.console import Console
+
+# One Console for every command: construction probes the terminal
+# (size, color support, env vars), which only needs to happen once.
+console = Console()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
 
 import click
@@ -9,6 +10,7 @@ import click
 # Suppress noisy httpx request logs in normal mode
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
+from coastwatch.common.beaches import beaches_by_id
 from coastwatch.config.loader import load_beaches, load_settings, resolve_path
 from coastwatch.storage.database import Database
 from coastwatch.storage.repository import ObservationRepository
@@ -34,12 +36,43 @@ def build_context(config_path: str | None, settings_path: str | None) -> dict:
     return {
         "settings": settings,
         "beaches": beaches,
+        "beaches_by_id": beaches_by_id(beaches),
         "db": db,
         "repo": repo,
     }
 
 
-@click.group()
+# Command name -> module; each module defines a command of the same name.
+_COMMANDS = {
+    "beaches": "coastwatch.cli.commands.beaches",
+    "best": "coastwatch.cli.commands.best",
+    "capture": "coastwatch.cli.commands.capture",
+    "export": "coastwatch.cli.commands.export",
+    "history": "coastwatch.cli.commands.history",
+    "status": "coastwatch.cli.commands.status",
+    "train": "coastwatch.cli.commands.train",
+}
+
+
+class LazyGroup(click.Group):
+    """Group that imports a command module only when it is invoked.
+
+    capture/train transitively pull in OpenCV, ultralytics, and the
+    Anthropic SDK; loading them lazily keeps lightweight commands like
+    `beaches` at interpreter-startup speed.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(_COMMANDS)
+
+    def get_command(self, ctx: click.Context, name: str) -> click.Command | None:
+        module_name = _COMMANDS.get(name)
+        if module_name is None:
+            return None
+        return getattr(importlib.import_module(module_name), name)
+
+
+@click.group(cls=LazyGroup)
 @click.option("--config", "-c", default=None, help="Path to beaches.yaml config")
 @click.option("--settings", "-s", default=None, help="Path to settings.yaml config")
 @click.option("--verbose", "-v", is_flag=True, help="Enable debug logging")
@@ -49,21 +82,3 @@ def cli(ctx: click.Context, config: str | None, settings: str | None, verbose: b
     setup_logging("DEBUG" if verbose else "INFO")
     ctx.ensure_object(dict)
     ctx.obj.update(build_context(config, settings))
-
-
-# Import and register commands
-from coastwatch.cli.commands.beaches import beaches  # noqa: E402
-from coastwatch.cli.commands.best import best  # noqa: E402
-from coastwatch.cli.commands.capture import capture  # noqa: E402
-from coastwatch.cli.commands.history import history  # noqa: E402
-from coastwatch.cli.commands.export import export  # noqa: E402
-from coastwatch.cli.commands.status import status  # noqa: E402
-from coastwatch.cli.commands.train import train  # noqa: E402
-
-cli.add_command(beaches)
-cli.add_command(best)
-cli.add_command(capture)
-cli.add_command(export)
-cli.add_command(history)
-cli.add_command(status)
-cli.add_command(train)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import click
-from rich.console import Console
 from rich.table import Table
 
+from coastwatch.cli import console
+
 
 @click.command()
 @click.option("--region", "-r", default=None, help="Filter by region")
@@ -17,7 +18,6 @@ def beaches(ctx: click.Context, region: str | None) -> None:
     if region:
         beach_list = [b for b in beach_list if region.lower() in b.region.lower()]
 
-    console = Console()
     table = Table(title="BAYWATCH — Configured Beaches")
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="bold")
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import json
+import operator
 
 import click
-from rich.console import Console
 from rich.table import Table
 
+from coastwatch.cli import console
+
+# Pull every ranked-row field in one C-level tuple build; the or-chain
+# fallbacks then run on locals instead of re-fetching attributes.
+_ROW_FIELDS = operator.attrgetter(
+    "beach_id", "ai_beach_score", "person_count",
+    "ai_wave_size", "cv_wave_level",
+    "weather_temperature_c", "weather_condition", "ai_weather_condition",
+    "ai_current_danger_level", "ai_current_rip_detected", "ai_best_for",
+)
+
 
 @click.command()
 @click.option("--activity", "-a",
@@ -19,8 +30,6 @@ from rich.table import Table
 def best(ctx: click.Context, activity: str, max_age: int, as_json: bool) -> None:
     """Rank beaches by current conditions."""
     repo = ctx.obj["repo"]
-    beaches = ctx.obj["beaches"]
-    console = Console()
 
     observations = repo.get_best_beaches(max_age_minutes=max_age)
 
@@ -36,7 +45,7 @@ def best(ctx: click.Context, activity: str, max_age: int, as_json: bool) -> None
         )
         raise SystemExit(0)
 
-    beach_map = {b.id: b for b in beaches}
+    beach_map = ctx.obj["beaches_by_id"]
 
     if as_json:
         data = []
@@ -70,29 +79,31 @@ def best(ctx: click.Context, activity: str, max_age: int, as_json: bool) -> None
     table.add_column("Safety", style="dim")
     table.add_column("Best for", style="dim")
 
-    for i, obs in enumerate(observations, 1):
-        b = beach_map.get(obs.beach_id)
-        name = b.name if b else obs.beach_id
-        score = f"{obs.ai_beach_score:.1f}" if obs.ai_beach_score else "-"
-        people = str(obs.person_count) if obs.person_count is not None else "-"
-        waves = obs.ai_wave_size or obs.cv_wave_level or "?"
+    for i, (beach_id, beach_score, person_count, ai_wave, cv_wave,
+            temp_c, weather_cond, ai_weather, danger_level, rip, best_for_list
+            ) in enumerate(map(_ROW_FIELDS, observations), 1):
+        b = beach_map.get(beach_id)
+        name = b.name if b else beach_id
+        score = f"{beach_score:.1f}" if beach_score else "-"
+        people = str(person_count) if person_count is not None else "-"
+        waves = ai_wave or cv_wave or "?"
 
         # Weather: show temperature if available
-        if obs.weather_temperature_c is not None:
-            weather = f"{obs.weather_temperature_c:.0f}°C {obs.weather_condition or ''}"
+        if temp_c is not None:
+            weather = f"{temp_c:.0f}°C {weather_cond or ''}"
         else:
-            weather = obs.ai_weather_condition or "?"
+            weather = ai_weather or "?"
 
         # Safety column (currents)
-        danger = obs.ai_current_danger_level or "-"
-        if obs.ai_current_rip_detected:
+        danger = danger_level or "-"
+        if rip:
             danger = f"[red bold]{danger} RIP![/red bold]"
         elif danger in ("high", "extreme"):
             danger = f"[red]{danger}[/red]"
         elif danger == "moderate":
             danger = f"[yellow]{danger}[/yellow]"
 
-        best_for = ", ".join(obs.ai_best_for) if obs.ai_best_for else "-"
+        best_for = ", ".join(best_for_list) if best_for_list else "-"
 
         style = "bold green" if i == 1 else None
         table.add_row(str(i), name, score, people, waves, weather, danger, best_for, style=style)
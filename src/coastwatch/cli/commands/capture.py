@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 
 import click
-from rich.console import Console
 
 from coastwatch.analysis.opencv_analyzer import ImageAnalyzer
 from coastwatch.analysis.person_detector import PersonDetector
@@ -14,6 +13,7 @@ from coastwatch.analysis.vision_client import VisionClient
 from coastwatch.analysis.weather_client import WeatherClient
 from coastwatch.capture.grabber import FrameGrabber
 from coastwatch.capture.scheduler import CaptureScheduler
+from coastwatch.cli import console
 from coastwatch.common.rate_limiter import TokenBucketRateLimiter
 
 
@@ -27,7 +27,6 @@ def capture(ctx: click.Context, once: bool, beach: tuple[str, ...], no_ai: bool)
     settings = ctx.obj["settings"]
     beaches = ctx.obj["beaches"]
     repo = ctx.obj["repo"]
-    console = Console()
 
     # Build components
     grabber = FrameGrabber(
@@ -2,67 +2,121 @@
 
 from __future__ import annotations
 
+import csv
 import json
+import operator
+import sys
 
 import click
-from rich.console import Console
 from rich.table import Table
+from rich.text import Text
+
+from coastwatch.cli import console
+
+# orjson serializes record lists several times faster than stdlib json;
+# optional, the stdlib path stays as fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One C-level tuple build per observation instead of ~11 attribute
+# lookups per row in each rendering loop.
+_ROW_FIELDS = operator.attrgetter(
+    "captured_at", "camera_status", "person_count",
+    "ai_wave_size", "cv_wave_level",
+    "weather_temperature_c", "weather_condition", "ai_weather_condition",
+    "ai_current_danger_level", "ai_beach_score", "ai_surf_score",
+)
 
 
 @click.command()
 @click.argument("beach_id")
 @click.option("--hours", "-h", default=24, help="Hours of history to show")
 @click.option("--format", "fmt", type=click.Choice(["table", "csv", "json"]), default="table")
+@click.option("--bucket", type=click.Choice(["none", "1h"]), default="none",
+              help="Downsample to the latest observation per hour")
 @click.pass_context
-def history(ctx: click.Context, beach_id: str, hours: int, fmt: str) -> None:
+def history(ctx: click.Context, beach_id: str, hours: int, fmt: str, bucket: str) -> None:
     """Show historical conditions for a beach."""
     repo = ctx.obj["repo"]
-    beaches = ctx.obj["beaches"]
-    console = Console()
 
-    beach = next((b for b in beaches if b.id == beach_id), None)
+    beach = ctx.obj["beaches_by_id"].get(beach_id)
     if not beach:
         console.print(f"[red]Unknown beach: {beach_id}[/red]")
         raise SystemExit(1)
 
     observations = repo.get_history(beach_id, hours=hours)
+
+    if bucket == "1h":
+        # One pass keyed on the YYYY-MM-DDTHH prefix; rows arrive newest
+        # first, so setdefault keeps the latest observation per hour.
+        by_hour = {}
+        for obs in observations:
+            by_hour.setdefault(obs.captured_at[:13], obs)
+        observations = list(by_hour.values())
+
     if not observations:
         console.print(f"[yellow]No data for {beach.name} in the last {hours}h.[/yellow]")
         raise SystemExit(0)
 
     if fmt == "json":
         data = []
-        for obs in observations:
+        for (captured_at, cam_status, people, ai_wave, cv_wave,
+             temp, weather, ai_weather, danger, beach_score, surf_score
+             ) in map(_ROW_FIELDS, observations):
             data.append({
-                "captured_at": obs.captured_at,
-                "camera_status": obs.camera_status,
-                "people": obs.person_count,
-                "waves": obs.ai_wave_size or obs.cv_wave_level,
-                "temp_c": obs.weather_temperature_c,
-                "weather": obs.weather_condition or obs.ai_weather_condition,
-                "current_danger": obs.ai_current_danger_level,
-                "beach_score": obs.ai_beach_score,
-                "surf_score": obs.ai_surf_score,
+                "captured_at": captured_at,
+                "camera_status": cam_status,
+                "people": people,
+                "waves": ai_wave or cv_wave,
+                "temp_c": temp,
+                "weather": weather or ai_weather,
+                "current_danger": danger,
+                "beach_score": beach_score,
+                "surf_score": surf_score,
             })
-        console.print(json.dumps(data, indent=2, ensure_ascii=False))
+        if orjson is not None:
+            click.echo(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            # Stream encoder chunks straight to stdout instead of also
+            # holding the full JSON string in memory.
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+            for chunk in encoder.iterencode(data):
+                sys.stdout.write(chunk)
+            sys.stdout.write("\n")
         return
 
     if fmt == "csv":
-        console.print("captured_at,camera,people,waves,temp_c,weather,currents,beach_score,surf_score")
-        for obs in observations:
-            cam = obs.camera_status or ""
-            people = obs.person_count if obs.person_count is not None else ""
-            waves = obs.ai_wave_size or obs.cv_wave_level or ""
-            temp = f"{obs.weather_temperature_c:.1f}" if obs.weather_temperature_c is not None else ""
-            weather = obs.weather_condition or obs.ai_weather_condition or ""
-            currents = obs.ai_current_danger_level or ""
-            score = obs.ai_beach_score or ""
-            surf = obs.ai_surf_score or ""
-            console.print(f"{obs.captured_at},{cam},{people},{waves},{temp},{weather},{currents},{score},{surf}")
+        # csv.writer formats and quotes rows in C — fields containing a
+        # comma used to be emitted unescaped — and writes straight to
+        # stdout, bypassing Rich entirely.
+        writer = csv.writer(sys.stdout)
+        writer.writerow(["captured_at", "camera", "people", "waves", "temp_c",
+                         "weather", "currents", "beach_score", "surf_score"])
+        # Bound .format method hoisted out of the loop: the format spec is
+        # parsed once instead of per row.
+        fmt1 = "{:.1f}".format
+        writer.writerows(
+            (captured_at,
+             cam_status or "",
+             people if people is not None else "",
+             ai_wave or cv_wave or "",
+             fmt1(temp_c) if temp_c is not None else "",
+             weather_cond or ai_weather or "",
+             danger or "",
+             beach_score or "",
+             surf_score or "")
+            for (captured_at, cam_status, people, ai_wave, cv_wave,
+                 temp_c, weather_cond, ai_weather, danger, beach_score, surf_score
+                 ) in map(_ROW_FIELDS, observations)
+        )
         return
 
     # Table format
-    table = Table(title=f"BAYWATCH — {beach.name} — Last {hours}h ({len(observations)} observations)")
+    # A Text title skips Rich's markup tokenizer and keeps beach names
+    # containing "[" from being parsed as markup.
+    table = Table(title=Text(f"BAYWATCH — {beach.name} — Last {hours}h ({len(observations)} observations)"))
     table.add_column("Time", style="dim")
     table.add_column("Cam", style="dim")
     table.add_column("People", justify="right")
@@ -72,15 +126,24 @@ def history(ctx: click.Context, beach_id: str, hours: int, fmt: str) -> None:
     table.add_column("Currents")
     table.add_column("Score", justify="right")
 
-    for obs in observations:
-        time_str = obs.captured_at[11:16] if len(obs.captured_at) > 16 else obs.captured_at
-        cam = obs.camera_status or "?"
-        people = str(obs.person_count) if obs.person_count is not None else "-"
-        waves = obs.ai_wave_size or obs.cv_wave_level or "?"
-        temp = f"{obs.weather_temperature_c:.0f}°C" if obs.weather_temperature_c is not None else "-"
-        weather = obs.weather_condition or obs.ai_weather_condition or "?"
-        currents = obs.ai_current_danger_level or "-"
-        score = f"{obs.ai_beach_score:.1f}" if obs.ai_beach_score else "-"
-        table.add_row(time_str, cam, people, waves, temp, weather, currents, score)
+    fmt0_temp = "{:.0f}°C".format
+    fmt1 = "{:.1f}".format
+    # Render all cells in one comprehension first; the add_row loop then
+    # only feeds finished strings to Rich (styles live on the columns).
+    rows = [
+        (captured_at[11:16] if len(captured_at) > 16 else captured_at,
+         cam_status or "?",
+         str(people) if people is not None else "-",
+         ai_wave or cv_wave or "?",
+         fmt0_temp(temp_c) if temp_c is not None else "-",
+         weather_cond or ai_weather or "?",
+         danger or "-",
+         fmt1(beach_score) if beach_score else "-")
+        for (captured_at, cam_status, people, ai_wave, cv_wave,
+             temp_c, weather_cond, ai_weather, danger, beach_score, _surf_score
+             ) in map(_ROW_FIELDS, observations)
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
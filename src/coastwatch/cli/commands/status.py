@@ -6,9 +6,18 @@ import json
 from datetime import datetime, timezone
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
+
+from coastwatch.cli import console
+
+# orjson serializes the status document several times faster than stdlib
+# json; optional, the stdlib path stays as fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 @click.command()
@@ -18,10 +27,8 @@ from rich.table import Table
 def status(ctx: click.Context, beach_id: str, as_json: bool) -> None:
     """Show current conditions for a specific beach."""
     repo = ctx.obj["repo"]
-    beaches = ctx.obj["beaches"]
-    console = Console()
 
-    beach = next((b for b in beaches if b.id == beach_id), None)
+    beach = ctx.obj["beaches_by_id"].get(beach_id)
     if not beach:
         console.print(f"[red]Unknown beach: {beach_id}[/red]")
         console.print("Run 'baywatch beaches' to see available beaches.")
@@ -61,12 +68,19 @@ def status(ctx: click.Context, beach_id: str, as_json: bool) -> None:
             "summary": obs.ai_summary,
             "best_for": obs.ai_best_for,
         }
-        console.print(json.dumps(data, indent=2, ensure_ascii=False))
+        if orjson is not None:
+            click.echo(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            click.echo(json.dumps(data, indent=2, ensure_ascii=False))
         return
 
     # Calculate age
     try:
-        captured = datetime.fromisoformat(obs.captured_at.replace("Z", "+00:00"))
+        # Python 3.11 fromisoformat accepts the trailing "Z" directly, so
+        # no intermediate string copy is needed.
+        captured = datetime.fromisoformat(obs.captured_at)
+        if captured.tzinfo is None:
+            captured = captured.replace(tzinfo=timezone.utc)
         age_min = int((datetime.now(timezone.utc) - captured).total_seconds() / 60)
         age_str = f"{age_min} min ago" if age_min < 60 else f"{age_min // 60}h{age_min % 60:02d} ago"
     except Exception:
@@ -155,8 +169,10 @@ def status(ctx: click.Context, beach_id: str, as_json: bool) -> None:
     if obs.ai_best_for:
         table.add_row("Best for", ", ".join(obs.ai_best_for))
 
-    title = f"{beach.name}"
-    subtitle = f"Last updated: {obs.captured_at[:19]} ({age_str})"
+    # Text instances skip Rich's markup tokenizer and keep beach names
+    # containing "[" from being parsed as markup.
+    title = Text(beach.name)
+    subtitle = Text(f"Last updated: {obs.captured_at[:19]} ({age_str})")
 
     panel = Panel(table, title=title, subtitle=subtitle, border_style="blue")
     console.print(panel)
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-from rich.console import Console
+
+from coastwatch.cli import console
 
 FRAMES_DIR = Path("~/.coastwatch/frames").expanduser()
 
+# Images per inference call during auto-labeling; batching amortizes the
+# per-call model overhead on both CPU and GPU.
+_LABEL_BATCH = 16
+
 
 @click.command()
 @click.option("--epochs", default=50, help="Number of training epochs")
@@ -28,7 +35,6 @@ def train(ctx: click.Context, epochs: int, model: str, data_dir: str) -> None:
     generates labels on your collected frames, then trains on them.
     This improves detection on your specific beach webcams over time.
     """
-    console = Console()
 
     data_path = Path(data_dir).expanduser()
     data_path.mkdir(parents=True, exist_ok=True)
@@ -36,25 +42,36 @@ def train(ctx: click.Context, epochs: int, model: str, data_dir: str) -> None:
     images_dir = data_path / "images" / "train"
     images_dir.mkdir(parents=True, exist_ok=True)
 
-    # Collect all saved frames
+    # Collect all saved frames. One scandir pass per directory and a
+    # membership set instead of a Path.exists() syscall per frame.
+    staged = {entry.name for entry in os.scandir(images_dir)}
     frame_count = 0
     if FRAMES_DIR.exists():
-        for beach_dir in FRAMES_DIR.iterdir():
+        for beach_dir in os.scandir(FRAMES_DIR):
             if not beach_dir.is_dir():
                 continue
-            for frame in beach_dir.glob("*.jpg"):
-                dest = images_dir / f"{beach_dir.name}_{frame.name}"
-                if not dest.exists():
-                    shutil.copy2(frame, dest)
+            for frame in os.scandir(beach_dir.path):
+                if not frame.name.endswith(".jpg"):
+                    continue
+                dest_name = f"{beach_dir.name}_{frame.name}"
+                if dest_name not in staged:
+                    # Hardlink instead of copying: metadata-only, no byte
+                    # traffic. Falls back to a copy across filesystems.
+                    dest = images_dir / dest_name
+                    try:
+                        os.link(frame.path, dest)
+                    except OSError:
+                        shutil.copy2(frame.path, dest)
+                    staged.add(dest_name)
                     frame_count += 1
 
-    if frame_count == 0 and not any(images_dir.iterdir()):
+    if frame_count == 0 and not staged:
         console.print("[yellow]No frames collected yet.[/yellow]")
         console.print("Run 'baywatch capture' for a while to collect training data first.")
         raise SystemExit(0)
 
-    total_images = len(list(images_dir.glob("*.jpg")))
-    console.print(f"[bold]Training data:[/bold] {total_images} frames ({frame_count} new)")
+    image_names = sorted(name for name in staged if name.endswith(".jpg"))
+    console.print(f"[bold]Training data:[/bold] {len(image_names)} frames ({frame_count} new)")
 
     # Step 1: Auto-label with current model
     console.print("\n[bold]Step 1/2:[/bold] Generating labels with current model...")
@@ -69,28 +86,39 @@ def train(ctx: click.Context, epochs: int, model: str, data_dir: str) -> None:
 
     base_model = YOLO(model)
 
+    have_labels = {entry.name for entry in os.scandir(labels_dir)}
     labeled = 0
-    for img_path in images_dir.glob("*.jpg"):
-        label_path = labels_dir / f"{img_path.stem}.txt"
-        if label_path.exists():
+    unlabeled: list[Path] = []
+    for name in image_names:
+        if f"{name.removesuffix('.jpg')}.txt" in have_labels:
             labeled += 1
-            continue
-
-        results = base_model(str(img_path), conf=0.2, verbose=False)
-        lines = []
-        for r in results:
-            for box in r.boxes:
-                if int(box.cls[0]) == 0:  # person class
-                    # YOLO format: class x_center y_center width height (normalized)
-                    x1, y1, x2, y2 = box.xyxyn[0].tolist()
-                    cx = (x1 + x2) / 2
-                    cy = (y1 + y2) / 2
-                    w = x2 - x1
-                    h = y2 - y1
-                    lines.append(f"0 {cx:.6f} {cy:.6f} {w:.6f} {h:.6f}")
-
-        label_path.write_text("\n".join(lines))
-        labeled += 1
+        else:
+            unlabeled.append(images_dir / name)
+
+    # Label writes go to a small thread pool so disk I/O overlaps with
+    # inference of the next batch instead of stalling it.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        writes = []
+        for start in range(0, len(unlabeled), _LABEL_BATCH):
+            chunk = unlabeled[start:start + _LABEL_BATCH]
+            results = base_model([str(p) for p in chunk], conf=0.2, verbose=False)
+            for img_path, r in zip(chunk, results):
+                lines = []
+                for box in r.boxes:
+                    if int(box.cls[0]) == 0:  # person class
+                        # YOLO format: class x_center y_center width height (normalized)
+                        x1, y1, x2, y2 = box.xyxyn[0].tolist()
+                        cx = (x1 + x2) / 2
+                        cy = (y1 + y2) / 2
+                        w = x2 - x1
+                        h = y2 - y1
+                        lines.append(f"0 {cx:.6f} {cy:.6f} {w:.6f} {h:.6f}")
+
+                label_path = labels_dir / f"{img_path.stem}.txt"
+                writes.append(pool.submit(label_path.write_text, "\n".join(lines)))
+                labeled += 1
+        for write in writes:
+            write.result()
 
     console.print(f"  Labeled {labeled} images")
 
@@ -0,0 +1,10 @@
+"""Small helpers for working with beach configuration lists."""
+
+from __future__ import annotations
+
+from coastwatch.config.models import BeachConfig
+
+
+def beaches_by_id(beaches: list[BeachConfig]) -> dict[str, BeachConfig]:
+    """Index beaches by id for O(1) lookups instead of linear scans."""
+    return {b.id: b for b in beaches}
@@ -18,7 +18,11 @@ class WebcamUnavailableError(CoastwatchError):
         self.beach_id = beach_id
         self.urls_tried = urls_tried
         self.last_error = last_error
-        super().__init__(f"Webcam unavailable for {beach_id}: tried {len(urls_tried)} URL(s)")
+
+    def __str__(self) -> str:
+        # Built lazily: retried-and-swallowed raises never pay for the
+        # message formatting.
+        return f"Webcam unavailable for {self.beach_id}: tried {len(self.urls_tried)} URL(s)"
 
 
 class ImageQualityError(CoastwatchError):
@@ -30,8 +34,11 @@ class VisionAnalysisError(CoastwatchError):
 
     def __init__(self, beach_id: str, message: str, status_code: int | None = None):
         self.beach_id = beach_id
+        self.message = message
         self.status_code = status_code
-        super().__init__(f"Vision analysis failed for {beach_id}: {message}")
+
+    def __str__(self) -> str:
+        return f"Vision analysis failed for {self.beach_id}: {self.message}"
 
 
 class VisionParseError(CoastwatchError):
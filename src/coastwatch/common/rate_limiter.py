@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from coastwatch.common.exceptions import RateLimitError
 
@@ -14,18 +14,35 @@ class TokenBucketRateLimiter:
 
     def __init__(self, rpm: int = 30, daily: int = 500):
         self._rpm = rpm
+        self._rate_per_sec = rpm / 60.0
         self._daily = daily
         self._tokens = float(rpm)
         self._last_refill = time.monotonic()
         self._daily_used = 0
-        self._daily_reset_date = datetime.now(timezone.utc).date()
+        self._next_daily_reset = self._next_midnight_mono()
+
+    @staticmethod
+    def _next_midnight_mono() -> float:
+        """Monotonic deadline for the next midnight UTC."""
+        now = datetime.now(timezone.utc)
+        midnight = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return time.monotonic() + (midnight - now).total_seconds()
+
+    def _check_day_rollover(self) -> None:
+        """Reset the daily budget when the UTC day boundary has passed.
+
+        Compares monotonic time against a precomputed deadline;
+        datetime.now only runs once per UTC day.
+        """
+        if time.monotonic() >= self._next_daily_reset:
+            self._daily_used = 0
+            self._next_daily_reset = self._next_midnight_mono()
 
     async def acquire(self) -> None:
         """Wait until a token is available. Raises RateLimitError if daily cap reached."""
-        today = datetime.now(timezone.utc).date()
-        if today != self._daily_reset_date:
-            self._daily_used = 0
-            self._daily_reset_date = today
+        self._check_day_rollover()
 
         if self._daily_used >= self._daily:
             raise RateLimitError(
@@ -33,23 +50,18 @@ class TokenBucketRateLimiter:
             )
 
         while True:
-            self._refill()
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(float(self._rpm), self._tokens + elapsed * self._rate_per_sec)
+            self._last_refill = now
             if self._tokens >= 1.0:
                 self._tokens -= 1.0
                 self._daily_used += 1
                 return
-            wait_time = (1.0 - self._tokens) / (self._rpm / 60.0)
+            wait_time = (1.0 - self._tokens) / self._rate_per_sec
             await asyncio.sleep(wait_time)
 
-    def _refill(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last_refill
-        self._tokens = min(float(self._rpm), self._tokens + elapsed * (self._rpm / 60.0))
-        self._last_refill = now
-
     @property
     def remaining_today(self) -> int:
-        today = datetime.now(timezone.utc).date()
-        if today != self._daily_reset_date:
-            return self._daily
+        self._check_day_rollover()
         return max(0, self._daily - self._daily_used)
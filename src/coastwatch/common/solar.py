@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 
 from astral import LocationInfo
 from astral.sun import sun
 
 
+@lru_cache(maxsize=256)
+def _sun_cached(latitude: float, longitude: float, tz_name: str, ordinal: int) -> dict[str, datetime]:
+    """Sun times for one location and day.
+
+    Sun times only change once per day per location, so the astronomical
+    math runs once per (lat, lon, date) and every later call within the
+    day is a cache lookup.
+    """
+    loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tz_name)
+    return sun(loc.observer, date=date.fromordinal(ordinal), tzinfo=timezone.utc)
+
+
 def is_daylight(latitude: float, longitude: float, tz_name: str = "Europe/Paris") -> bool:
     """Return True if the sun is currently up at the given coordinates."""
-    loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tz_name)
     now = datetime.now(timezone.utc)
     try:
-        s = sun(loc.observer, date=now.date(), tzinfo=timezone.utc)
+        s = _sun_cached(latitude, longitude, tz_name, now.date().toordinal())
         return s["sunrise"] <= now <= s["sunset"]
     except Exception:
         # In polar regions or edge cases, assume daylight
@@ -22,7 +34,6 @@ def is_daylight(latitude: float, longitude: float, tz_name: str = "Europe/Paris"
 
 def get_sun_times(latitude: float, longitude: float, tz_name: str = "Europe/Paris") -> dict[str, datetime]:
     """Return sunrise/sunset times for today at the given coordinates."""
-    loc = LocationInfo(latitude=latitude, longitude=longitude, timezone=tz_name)
     now = datetime.now(timezone.utc)
-    s = sun(loc.observer, date=now.date(), tzinfo=timezone.utc)
+    s = _sun_cached(latitude, longitude, tz_name, now.date().toordinal())
     return {"sunrise": s["sunrise"], "sunset": s["sunset"]}
@@ -3,21 +3,71 @@
 from __future__ import annotations
 
 import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, TypeVar
 
 import yaml
+from pydantic import TypeAdapter
+
+from coastwatch import __version__
+
+# libyaml-backed loader parses several times faster than the pure-Python
+# one; fall back when PyYAML was built without it.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 from coastwatch.config.models import AppSettings, BeachConfig
 
 DEFAULT_CONFIG_DIR = Path(__file__).parent.parent.parent.parent / "config"
 
+_T = TypeVar("_T")
+
+# Building a TypeAdapter compiles a pydantic-core schema, which is far
+# more expensive than reusing one; cache adapters across loads.
+_adapter = lru_cache(maxsize=8)(TypeAdapter)
+
+
+def _pickle_cached(path: Path, build: Callable[[], _T]) -> _T:
+    """Parse-and-validate once, then reuse a pickle sidecar until the YAML changes.
+
+    The sidecar lives next to the YAML file and is invalidated by mtime,
+    so warm CLI starts skip both the YAML parse and pydantic validation.
+    It is also stamped with the package version: a sidecar written by an
+    older release may pickle objects missing fields added to the models
+    since, so a stamp mismatch forces a rebuild. Cache read and write
+    failures (stale format, read-only config dir) fall through to the
+    normal load path.
+    """
+    cache = path.with_name(path.name + ".pkl")
+    try:
+        if cache.stat().st_mtime >= path.stat().st_mtime:
+            stamp, cached = pickle.loads(cache.read_bytes())
+            if stamp == __version__:
+                return cached
+    except Exception:
+        pass
+    result = build()
+    try:
+        cache.write_bytes(pickle.dumps((__version__, result), protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+    return result
+
 
 def load_beaches(config_path: str | Path | None = None) -> list[BeachConfig]:
     """Load beach configurations from YAML file."""
     path = Path(config_path) if config_path else DEFAULT_CONFIG_DIR / "beaches.yaml"
-    with open(path) as f:
-        data = yaml.safe_load(f)
-    return [BeachConfig(**beach) for beach in data.get("beaches", [])]
+
+    def _build() -> list[BeachConfig]:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YamlLoader)
+        return _adapter(list[BeachConfig]).validate_python(data.get("beaches", []))
+
+    return _pickle_cached(path, _build)
 
 
 def load_settings(settings_path: str | Path | None = None) -> AppSettings:
@@ -25,9 +75,13 @@ def load_settings(settings_path: str | Path | None = None) -> AppSettings:
     path = Path(settings_path) if settings_path else DEFAULT_CONFIG_DIR / "settings.yaml"
     if not path.exists():
         return AppSettings()
-    with open(path) as f:
-        data = yaml.safe_load(f) or {}
-    return AppSettings(**data)
+
+    def _build() -> AppSettings:
+        with open(path) as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        return AppSettings(**data)
+
+    return _pickle_cached(path, _build)
 
 
 def resolve_path(path_str: str) -> Path:
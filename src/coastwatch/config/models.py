@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 
 
 class WebcamConfig(BaseModel):
     snapshot_url: str
     type: str = "snapshot"  # snapshot | mjpeg | hls
     refresh_interval_sec: int = 300
-    headers: dict[str, str] = {}
-    fallback_urls: list[str] = []
+    headers: dict[str, str] = Field(default_factory=dict)
+    fallback_urls: list[str] = Field(default_factory=list)
 
 
 class Coordinates(BaseModel):
@@ -32,7 +32,7 @@ class BeachConfig(BaseModel):
     region: str
     coordinates: Coordinates
     webcam: WebcamConfig
-    metadata: BeachMetadata = BeachMetadata()
+    metadata: BeachMetadata = Field(default_factory=BeachMetadata)
 
 
 class CaptureSettings(BaseModel):
@@ -92,11 +92,11 @@ class LoggingSettings(BaseModel):
 
 
 class AppSettings(BaseModel):
-    capture: CaptureSettings = CaptureSettings()
-    opencv: OpenCVSettings = OpenCVSettings()
-    yolo: YOLOSettings = YOLOSettings()
-    weather_api: WeatherAPISettings = WeatherAPISettings()
-    camera: CameraSettings = CameraSettings()
-    claude: ClaudeSettings = ClaudeSettings()
-    storage: StorageSettings = StorageSettings()
-    logging: LoggingSettings = LoggingSettings()
+    capture: CaptureSettings = Field(default_factory=CaptureSettings)
+    opencv: OpenCVSettings = Field(default_factory=OpenCVSettings)
+    yolo: YOLOSettings = Field(default_factory=YOLOSettings)
+    weather_api: WeatherAPISettings = Field(default_factory=WeatherAPISettings)
+    camera: CameraSettings = Field(default_factory=CameraSettings)
+    claude: ClaudeSettings = Field(default_factory=ClaudeSettings)
+    storage: StorageSettings = Field(default_factory=StorageSettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
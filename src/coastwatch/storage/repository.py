@@ -3,12 +3,110 @@
 from __future__ import annotations
 
 import json
+import operator
+import sqlite3
 from dataclasses import dataclass, field
+from typing import Iterator
 
 from coastwatch.storage.database import Database
 
+# orjson decodes legacy JSON list values several times faster than
+# stdlib json; optional, the stdlib path stays as fallback.
+try:
+    import orjson
 
-@dataclass
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# List columns are stored as unit-separator-delimited text: pure C
+# string ops on both sides instead of a JSON tokenizer. The values are
+# short condition tags, which never contain the separator.
+_LIST_SEP = "\x1f"
+
+
+def _decode_list(raw: str) -> list[str]:
+    # Rows written before the delimited format hold JSON arrays. A delimited
+    # value whose first tag happens to start with "[" fails the parse and
+    # falls through to the split.
+    if raw.startswith("["):
+        try:
+            return _loads(raw)
+        except ValueError:
+            pass
+    return raw.split(_LIST_SEP)
+
+# Columns in Observation field order; selecting them explicitly keeps
+# legacy v0.1.0 columns out of query results and lets the row mapper
+# work positionally.
+_COLS = (
+    "beach_id", "captured_at", "source_url",
+    "camera_status", "camera_status_reason",
+    "person_count", "person_confidence", "detection_method",
+    "cv_wave_level", "cv_whitecap_ratio", "cv_edge_density", "cv_wave_confidence",
+    "cv_image_quality",
+    "weather_temperature_c", "weather_feels_like_c", "weather_humidity_pct",
+    "weather_wind_speed_kmh", "weather_wind_direction", "weather_wind_gust_kmh",
+    "weather_condition", "weather_description", "weather_precipitation_mm",
+    "weather_visibility_km", "weather_uv_index",
+    "ai_crowd_level", "ai_crowd_count", "ai_crowd_distribution", "ai_crowd_notes",
+    "ai_wave_size", "ai_wave_quality", "ai_wave_type", "ai_wave_period", "ai_wave_notes",
+    "ai_weather_condition", "ai_wind_estimate", "ai_wind_direction", "ai_visibility",
+    "ai_weather_notes",
+    "ai_current_danger_level", "ai_current_rip_detected", "ai_current_indicators",
+    "ai_current_notes",
+    "ai_beach_score", "ai_surf_score", "ai_summary", "ai_best_for",
+    "analysis_model", "processing_time_ms", "error_message",
+    "id",
+)
+_SELECT_COLS = ", ".join(_COLS)
+
+# Positions of the values _row_to_obs converts before construction.
+_RIP_IDX = _COLS.index("ai_current_rip_detected")
+_INDICATORS_IDX = _COLS.index("ai_current_indicators")
+_BEST_FOR_IDX = _COLS.index("ai_best_for")
+
+_INSERT_SQL = """INSERT INTO observations (
+    beach_id, captured_at, source_url,
+    camera_status, camera_status_reason,
+    person_count, person_confidence, detection_method,
+    cv_wave_level, cv_whitecap_ratio, cv_edge_density, cv_wave_confidence,
+    cv_image_quality,
+    weather_temperature_c, weather_feels_like_c, weather_humidity_pct,
+    weather_wind_speed_kmh, weather_wind_direction, weather_wind_gust_kmh,
+    weather_condition, weather_description, weather_precipitation_mm,
+    weather_visibility_km, weather_uv_index,
+    ai_crowd_level, ai_crowd_count, ai_crowd_distribution, ai_crowd_notes,
+    ai_wave_size, ai_wave_quality, ai_wave_type, ai_wave_period, ai_wave_notes,
+    ai_weather_condition, ai_wind_estimate, ai_wind_direction, ai_visibility, ai_weather_notes,
+    ai_current_danger_level, ai_current_rip_detected, ai_current_indicators, ai_current_notes,
+    ai_beach_score, ai_surf_score, ai_summary, ai_best_for,
+    analysis_model, processing_time_ms, error_message
+) VALUES (
+    ?, ?, ?,
+    ?, ?,
+    ?, ?, ?,
+    ?, ?, ?, ?,
+    ?,
+    ?, ?, ?,
+    ?, ?, ?,
+    ?, ?, ?,
+    ?, ?,
+    ?, ?, ?, ?,
+    ?, ?, ?, ?, ?,
+    ?, ?, ?, ?, ?,
+    ?, ?, ?, ?,
+    ?, ?, ?, ?,
+    ?, ?, ?
+)"""
+
+# RETURNING delivers the new id in the insert itself (SQLite >= 3.35);
+# older libraries fall back to cursor.lastrowid.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_INSERT_RETURNING_SQL = _INSERT_SQL + " RETURNING id"
+
+
+@dataclass(slots=True)
 class Observation:
     """A single observation record for a beach."""
     beach_id: str
@@ -75,125 +173,125 @@ class ObservationRepository:
     def __init__(self, db: Database):
         self._db = db
 
-    def save(self, obs: Observation) -> int:
-        """Insert a new observation. Returns row id."""
-        best_for_json = json.dumps(obs.ai_best_for) if obs.ai_best_for else None
-        indicators_json = json.dumps(obs.ai_current_indicators) if obs.ai_current_indicators else None
+    # Columns passed through unchanged, in INSERT order up to the first
+    # value that needs conversion; one C-level tuple build per row.
+    _ROW_HEAD = operator.attrgetter(
+        "beach_id", "captured_at", "source_url",
+        "camera_status", "camera_status_reason",
+        "person_count", "person_confidence", "detection_method",
+        "cv_wave_level", "cv_whitecap_ratio", "cv_edge_density", "cv_wave_confidence",
+        "cv_image_quality",
+        "weather_temperature_c", "weather_feels_like_c", "weather_humidity_pct",
+        "weather_wind_speed_kmh", "weather_wind_direction", "weather_wind_gust_kmh",
+        "weather_condition", "weather_description", "weather_precipitation_mm",
+        "weather_visibility_km", "weather_uv_index",
+        "ai_crowd_level", "ai_crowd_count", "ai_crowd_distribution", "ai_crowd_notes",
+        "ai_wave_size", "ai_wave_quality", "ai_wave_type", "ai_wave_period", "ai_wave_notes",
+        "ai_weather_condition", "ai_wind_estimate", "ai_wind_direction", "ai_visibility",
+        "ai_weather_notes",
+        "ai_current_danger_level",
+    )
+
+    @classmethod
+    def _to_row(cls, obs: Observation) -> tuple:
+        """Flatten an Observation into the INSERT parameter tuple."""
+        best_for_json = _LIST_SEP.join(obs.ai_best_for) if obs.ai_best_for else None
+        indicators_json = _LIST_SEP.join(obs.ai_current_indicators) if obs.ai_current_indicators else None
         rip_int = int(obs.ai_current_rip_detected) if obs.ai_current_rip_detected is not None else None
-        cursor = self._db.conn.execute(
-            """INSERT INTO observations (
-                beach_id, captured_at, source_url,
-                camera_status, camera_status_reason,
-                person_count, person_confidence, detection_method,
-                cv_wave_level, cv_whitecap_ratio, cv_edge_density, cv_wave_confidence,
-                cv_image_quality,
-                weather_temperature_c, weather_feels_like_c, weather_humidity_pct,
-                weather_wind_speed_kmh, weather_wind_direction, weather_wind_gust_kmh,
-                weather_condition, weather_description, weather_precipitation_mm,
-                weather_visibility_km, weather_uv_index,
-                ai_crowd_level, ai_crowd_count, ai_crowd_distribution, ai_crowd_notes,
-                ai_wave_size, ai_wave_quality, ai_wave_type, ai_wave_period, ai_wave_notes,
-                ai_weather_condition, ai_wind_estimate, ai_wind_direction, ai_visibility, ai_weather_notes,
-                ai_current_danger_level, ai_current_rip_detected, ai_current_indicators, ai_current_notes,
-                ai_beach_score, ai_surf_score, ai_summary, ai_best_for,
-                analysis_model, processing_time_ms, error_message
-            ) VALUES (
-                ?, ?, ?,
-                ?, ?,
-                ?, ?, ?,
-                ?, ?, ?, ?,
-                ?,
-                ?, ?, ?,
-                ?, ?, ?,
-                ?, ?, ?,
-                ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?, ?,
-                ?, ?, ?
-            )""",
-            (
-                obs.beach_id, obs.captured_at, obs.source_url,
-                obs.camera_status, obs.camera_status_reason,
-                obs.person_count, obs.person_confidence, obs.detection_method,
-                obs.cv_wave_level, obs.cv_whitecap_ratio, obs.cv_edge_density, obs.cv_wave_confidence,
-                obs.cv_image_quality,
-                obs.weather_temperature_c, obs.weather_feels_like_c, obs.weather_humidity_pct,
-                obs.weather_wind_speed_kmh, obs.weather_wind_direction, obs.weather_wind_gust_kmh,
-                obs.weather_condition, obs.weather_description, obs.weather_precipitation_mm,
-                obs.weather_visibility_km, obs.weather_uv_index,
-                obs.ai_crowd_level, obs.ai_crowd_count, obs.ai_crowd_distribution, obs.ai_crowd_notes,
-                obs.ai_wave_size, obs.ai_wave_quality, obs.ai_wave_type, obs.ai_wave_period, obs.ai_wave_notes,
-                obs.ai_weather_condition, obs.ai_wind_estimate, obs.ai_wind_direction, obs.ai_visibility,
-                obs.ai_weather_notes,
-                obs.ai_current_danger_level, rip_int, indicators_json, obs.ai_current_notes,
-                obs.ai_beach_score, obs.ai_surf_score, obs.ai_summary, best_for_json,
-                obs.analysis_model, obs.processing_time_ms, obs.error_message,
-            ),
+        return (
+            *cls._ROW_HEAD(obs),
+            rip_int, indicators_json, obs.ai_current_notes,
+            obs.ai_beach_score, obs.ai_surf_score, obs.ai_summary, best_for_json,
+            obs.analysis_model, obs.processing_time_ms, obs.error_message,
         )
-        self._db.conn.commit()
+
+    def save(self, obs: Observation) -> int:
+        """Insert a new observation. Returns row id."""
+        row = self._to_row(obs)
+        with self._db.conn:
+            if _HAS_RETURNING:
+                return self._db.conn.execute(_INSERT_RETURNING_SQL, row).fetchone()[0]
+            cursor = self._db.conn.execute(_INSERT_SQL, row)
         return cursor.lastrowid  # type: ignore[return-value]
 
-    def _row_to_obs(self, row: dict) -> Observation:
-        d = dict(row)
-        best_for_raw = d.pop("ai_best_for", None)
-        d["ai_best_for"] = json.loads(best_for_raw) if best_for_raw else []
-        indicators_raw = d.pop("ai_current_indicators", None)
-        d["ai_current_indicators"] = json.loads(indicators_raw) if indicators_raw else []
-        rip_raw = d.pop("ai_current_rip_detected", None)
-        d["ai_current_rip_detected"] = bool(rip_raw) if rip_raw is not None else None
-        d.pop("created_at", None)
-        # Handle legacy columns from v0.1.0 that no longer exist in Observation
-        for legacy_col in (
-            "cv_crowd_count", "cv_crowd_level", "cv_crowd_confidence",
-            "cv_weather_condition", "cv_brightness", "cv_blue_ratio",
-            "cv_visibility", "cv_weather_confidence",
-        ):
-            d.pop(legacy_col, None)
-        return Observation(**d)
+    def save_many(self, observations: list[Observation]) -> None:
+        """Insert several observations in one transaction.
+
+        A capture cycle writes one row per beach; batching them turns N
+        commits (one fsync each) into a single one.
+        """
+        if not observations:
+            return
+        with self._db.conn:
+            self._db.conn.executemany(_INSERT_SQL, [self._to_row(o) for o in observations])
+
+    def _row_to_obs(self, row: sqlite3.Row) -> Observation:
+        # Queries select _COLS in Observation field order, so the row
+        # unpacks positionally; only three values need converting first.
+        vals = list(row)
+        rip = vals[_RIP_IDX]
+        vals[_RIP_IDX] = bool(rip) if rip is not None else None
+        indicators = vals[_INDICATORS_IDX]
+        vals[_INDICATORS_IDX] = _decode_list(indicators) if indicators else []
+        best_for = vals[_BEST_FOR_IDX]
+        vals[_BEST_FOR_IDX] = _decode_list(best_for) if best_for else []
+        return Observation(*vals)
 
     def get_latest(self, beach_id: str) -> Observation | None:
         """Get most recent observation for a beach."""
         row = self._db.conn.execute(
-            "SELECT * FROM observations WHERE beach_id = ? ORDER BY captured_at DESC LIMIT 1",
+            f"SELECT {_SELECT_COLS} FROM observations WHERE beach_id = ? ORDER BY captured_at DESC LIMIT 1",
             (beach_id,),
         ).fetchone()
         return self._row_to_obs(row) if row else None
 
+    def iter_history(self, beach_id: str, hours: int = 24, limit: int = 100) -> Iterator[Observation]:
+        """Yield observations for a beach within the last N hours.
+
+        Rows are mapped as the cursor produces them, so iterate-once
+        callers never hold the full window in memory.
+        """
+        cursor = self._db.conn.execute(
+            f"""SELECT {_SELECT_COLS} FROM observations
+                WHERE beach_id = ? AND captured_at > datetime('now', ?)
+                ORDER BY captured_at DESC LIMIT ?""",
+            (beach_id, f"-{hours} hours", limit),
+        )
+        for row in cursor:
+            yield self._row_to_obs(row)
+
     def get_history(self, beach_id: str, hours: int = 24, limit: int = 100) -> list[Observation]:
         """Get observations for a beach within the last N hours."""
-        rows = self._db.conn.execute(
-            """SELECT * FROM observations
-               WHERE beach_id = ? AND captured_at > datetime('now', ?)
-               ORDER BY captured_at DESC LIMIT ?""",
-            (beach_id, f"-{hours} hours", limit),
-        ).fetchall()
-        return [self._row_to_obs(r) for r in rows]
+        return list(self.iter_history(beach_id, hours=hours, limit=limit))
 
     def get_best_beaches(self, max_age_minutes: int = 30) -> list[Observation]:
         """Rank beaches by score from most recent observations."""
+        # Window function instead of a self-join: one pass over the
+        # recency-filtered rows picks the newest observation per beach.
         rows = self._db.conn.execute(
-            """SELECT o.* FROM observations o
-               INNER JOIN (
-                   SELECT beach_id, MAX(captured_at) as latest
+            f"""SELECT {_SELECT_COLS} FROM (
+                   SELECT {_SELECT_COLS}, ROW_NUMBER() OVER (
+                       PARTITION BY beach_id ORDER BY captured_at DESC
+                   ) AS rn
                    FROM observations
                    WHERE captured_at > datetime('now', ?)
-                   GROUP BY beach_id
-               ) t ON o.beach_id = t.beach_id AND o.captured_at = t.latest
-               ORDER BY COALESCE(o.ai_beach_score, 5.0) DESC""",
+               )
+               WHERE rn = 1
+               ORDER BY COALESCE(ai_beach_score, 5.0) DESC""",
             (f"-{max_age_minutes} minutes",),
         ).fetchall()
         return [self._row_to_obs(r) for r in rows]
 
     def sync_beaches(self, beaches: list) -> None:
         """Sync beach registry from config into the beaches table."""
-        for b in beaches:
-            self._db.conn.execute(
+        rows = [
+            (b.id, b.name, b.region, b.coordinates.latitude, b.coordinates.longitude,
+             b.metadata.orientation, 1 if b.metadata.surf_spot else 0)
+            for b in beaches
+        ]
+        with self._db.conn:
+            self._db.conn.executemany(
                 """INSERT OR REPLACE INTO beaches (id, name, region, latitude, longitude, orientation, surf_spot)
                    VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (b.id, b.name, b.region, b.coordinates.latitude, b.coordinates.longitude,
-                 b.metadata.orientation, 1 if b.metadata.surf_spot else 0),
+                rows,
             )
-        self._db.conn.commit()